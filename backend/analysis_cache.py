@@ -0,0 +1,43 @@
+"""
+Cache keys for whole-analysis reuse across identical /process submissions
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict
+
+
+# Credentials never change what an analysis produces, so they stay out of the key
+SECRET_CONFIG_KEYS = ('api_key', 'search_engine_id')
+STATEMENT_FILES = ('common.json', 'leftist.json', 'rightist.json')
+
+
+def normalize_text(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def analysis_cache_key(config: Dict[str, Any], topic: str, text: str, data_folder: str = 'data') -> str:
+    digest = hashlib.sha256()
+    digest.update(normalize_text(topic).lower().encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(normalize_text(text).encode('utf-8'))
+
+    for filename in STATEMENT_FILES:
+        digest.update(b'\0' + filename.encode('utf-8') + b'\0')
+        path = os.path.join(data_folder, filename)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+
+    relevant_config = {k: v for k, v in config.items() if k not in SECRET_CONFIG_KEYS}
+    digest.update(json.dumps(relevant_config, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cache_max_age(config: Dict[str, Any]) -> float:
+    """Freshness window in seconds; 0 disables the cache"""
+    settings = config.get('cache_settings', {})
+    if not settings.get('enabled', True):
+        return 0
+    return float(settings.get('analysis_ttl_seconds', 86400))
+
@@ -0,0 +1,161 @@
+"""
+Batch analysis of many topics from a JSONL file
+Each line is {"id"?, "topic", "text", "common": [...], "leftist": [...], "rightist": [...]}.
+Topics run in a process pool under shared Gemini/Search rate limits, and every finished
+topic is appended to a checkpoint file so an interrupted batch resumes where it stopped.
+"""
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Tuple
+
+from main import RelevanceSearchSystem
+from rate_limiter import SharedRateLimiter, shared_gemini_rate
+from state_store import SQLiteStateStore
+from workspace import Workspace
+
+
+def topic_key(entry: Dict[str, Any]) -> str:
+    """Stable key per topic: the explicit id, otherwise a hash of the entry itself"""
+    if entry.get('id'):
+        return str(entry['id'])
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def load_topics(path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    topics = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not entry.get('topic'):
+                raise ValueError(f"{path}:{line_number}: missing 'topic'")
+            topics.append((topic_key(entry), entry))
+    return topics
+
+
+def load_checkpoint(path: str) -> Dict[str, Dict[str, Any]]:
+    """Latest checkpoint record per topic key; a torn last line from a crash is ignored"""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record['key']] = record
+    return records
+
+
+def append_checkpoint(path: str, record: Dict[str, Any]) -> None:
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def run_topic(config_path: str, jobs_root: str, key: str, entry: Dict[str, Any], limits: Dict[str, float]) -> Dict[str, Any]:
+    """Analyze one topic in its own workspace; runs inside a pool worker process"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    job_id = f"batch-{key}"
+    data_folder = os.path.join(jobs_root, job_id, 'data')
+    workspace = Workspace.create_job(
+        {'topic': entry['topic'], 'text': entry.get('text', '')},
+        jobs_root=jobs_root,
+        data_folder=data_folder,
+        job_id=job_id
+    )
+    os.makedirs(data_folder, exist_ok=True)
+    for perspective in Workspace.PERSPECTIVES:
+        workspace.write_json(os.path.join(data_folder, f'{perspective}.json'), entry.get(perspective, []))
+
+    state_store = SQLiteStateStore.from_config(config)
+    state_store.create_job(job_id, 'analysis', workspace.output_dir)
+
+    rate_limiters = {
+        name: SharedRateLimiter.from_config(config, name, per_minute)
+        for name, per_minute in limits.items()
+        if per_minute > 0
+    }
+
+    started = time.time()
+    try:
+        with open(workspace.output_path('run.log'), 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+            system = RelevanceSearchSystem(config_path=config_path, workspace=workspace, rate_limiters=rate_limiters)
+            try:
+                system.process_all_files(resume=True)
+            finally:
+                system.cleanup()
+    except Exception as e:
+        state_store.update_job(job_id, status='error', error=str(e))
+        raise
+
+    usage = system.usage.report()
+    state_store.update_job(job_id, status='completed', topic_id=system.topic_id, result={'usage': usage})
+    return {
+        'job_id': job_id,
+        'topic_id': system.topic_id,
+        'usage': usage['totals'],
+        'seconds': round(time.time() - started, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='JSONL file with one topic per line')
+    parser.add_argument('--config', default='config.json')
+    parser.add_argument('--checkpoint', help='Checkpoint file (default: <input>.checkpoint.jsonl)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: batch_settings.workers or CPU count)')
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    settings = config.get('batch_settings', {})
+
+    jobs_root = settings.get('jobs_root', 'jobs')
+    workers = args.workers or settings.get('workers') or os.cpu_count() or 1
+    limits = {
+        'gemini': shared_gemini_rate(config),
+        'search': settings.get('search_requests_per_minute', 100)
+    }
+    checkpoint_path = args.checkpoint or f"{args.input}.checkpoint.jsonl"
+
+    topics = load_topics(args.input)
+    done = load_checkpoint(checkpoint_path)
+    pending = [(key, entry) for key, entry in topics if done.get(key, {}).get('status') != 'completed']
+
+    print(f"Topics: {len(topics)}, already completed: {len(topics) - len(pending)}, to run: {len(pending)}")
+    print(f"Workers: {workers}, Gemini {limits['gemini']}/min, Search {limits['search']}/min shared")
+
+    completed = failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_topic, args.config, jobs_root, key, entry, limits): (key, entry)
+            for key, entry in pending
+        }
+        for future in as_completed(futures):
+            key, entry = futures[future]
+            record = {'key': key, 'topic': entry['topic'], 'finished_at': time.time()}
+            try:
+                record.update(future.result(), status='completed')
+                completed += 1
+            except Exception as e:
+                record.update(status='error', error=str(e)[:500])
+                failed += 1
+            append_checkpoint(checkpoint_path, record)
+            print(f"[{completed + failed}/{len(pending)}] {record['status']}: {entry['topic'][:60]}")
+
+    print(f"Batch finished: {completed} completed, {failed} failed, checkpoint {checkpoint_path}")
+
+
+if __name__ == '__main__':
+    main()
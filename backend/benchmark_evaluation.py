@@ -0,0 +1,95 @@
+"""
+Latency and agreement benchmark for the two Gemini evaluation modes
+Runs every link in relevant_*.json through check_relevance + check_trust_score (two_call)
+and through check_relevance_and_trust (combined) and compares timings and verdicts
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+from main import RelevanceSearchSystem
+
+
+RELEVANT_FILES = ["relevant_common.json", "relevant_leftist.json", "relevant_rightist.json"]
+
+
+def load_samples(limit: int) -> list:
+    samples = []
+    for path in RELEVANT_FILES:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data.get("items", []):
+            for link in item.get("relevant_links", []):
+                samples.append((
+                    {"title": link.get("title", ""), "link": link.get("link", ""), "snippet": link.get("snippet", "")},
+                    item.get("text", "")
+                ))
+    return samples[:limit]
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    system = RelevanceSearchSystem(config_path=args.config)
+    try:
+        if not system.gemini_model:
+            print("Gemini is not configured; set GOOGLE_API_KEY to run this benchmark")
+            return
+
+        # Priors would skip the trust call in both modes and hide the difference being measured
+        system.domain_trust = None
+        samples = load_samples(args.limit)
+
+        two_call_times, combined_times = [], []
+        relevance_agree = source_type_agree = 0
+        trust_diffs = []
+
+        for link, text in samples:
+            relevance, relevance_time = timed(system.check_relevance, link, text)
+            trust, trust_time = timed(system.check_trust_score, link)
+            two_call_times.append(relevance_time + trust_time)
+
+            combined, combined_time = timed(system.check_relevance_and_trust, link, text)
+            combined_times.append(combined_time)
+            combined_trust = combined.get("trust", {})
+
+            relevance_agree += relevance["relevant"] == combined["relevant"]
+            source_type_agree += trust["source_type"].lower() == combined_trust.get("source_type", "").lower()
+            trust_diffs.append(abs(float(trust["trust_score"]) - float(combined_trust.get("trust_score", 0.5))))
+            time.sleep(system.delay)
+
+        count = len(samples)
+        print("=" * 60)
+        print("EVALUATION MODE BENCHMARK")
+        print("=" * 60)
+        print(f"Links evaluated: {count}")
+        if not count:
+            return
+        print(f"two_call latency p50/mean: {statistics.median(two_call_times) * 1000:.0f} / "
+              f"{statistics.mean(two_call_times) * 1000:.0f} ms per link (2 Gemini calls)")
+        print(f"combined latency p50/mean: {statistics.median(combined_times) * 1000:.0f} / "
+              f"{statistics.mean(combined_times) * 1000:.0f} ms per link (1 Gemini call)")
+        print(f"Relevance verdict agreement: {relevance_agree / count:.0%}")
+        print(f"Source type agreement: {source_type_agree / count:.0%}")
+        print(f"Trust score mean abs difference: {statistics.mean(trust_diffs):.3f} "
+              f"(max {max(trust_diffs):.3f})")
+        print("=" * 60)
+    finally:
+        system.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Multi-worker throughput and consistency benchmark for the API server
+Starts server.py under uvicorn with 1 and N workers against a scratch database and
+hammers /results and /status, checking that every worker gives the same answer
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from result_store import ResultStore
+from state_store import SQLiteStateStore
+
+
+RELEVANT_FILES = {
+    "common": "relevant_common.json",
+    "leftist": "relevant_leftist.json",
+    "rightist": "relevant_rightist.json"
+}
+
+
+def prepare_scratch_config(scratch_dir: str) -> str:
+    """Copy config.json with storage pointed at a scratch database seeded from relevant_*.json"""
+    with open("config.json", "r", encoding="utf-8") as f:
+        config = json.load(f)
+    config.setdefault("storage_settings", {})["database"] = os.path.join(scratch_dir, "results.db")
+
+    config_path = os.path.join(scratch_dir, "config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=4)
+
+    publish_job(config, "benchmark-1")
+    return config_path
+
+
+def publish_job(config: dict, job_id: str) -> None:
+    result_store = ResultStore.from_config(config)
+    state_store = SQLiteStateStore.from_config(config)
+
+    topic_id = result_store.import_json_files(RELEVANT_FILES, job_id=job_id)
+    state_store.create_job(job_id, "analysis", os.path.join("jobs", job_id))
+    state_store.update_job(job_id, status="completed", topic_id=topic_id)
+    state_store.set_current("analysis", job_id)
+
+
+def start_server(port: int, workers: int, config_path: str) -> subprocess.Popen:
+    env = dict(os.environ, CONFIG_PATH=config_path)
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def wait_until_healthy(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy")
+
+
+async def run_load(base_url: str, duration: float, concurrency: int) -> dict:
+    latencies = []
+    etags = set()
+    pids = set()
+    current_jobs = set()
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    # A fresh connection per request lets the kernel spread requests over all worker processes
+    async def client_loop():
+        nonlocal errors
+        async with httpx.AsyncClient(base_url=base_url, timeout=10, limits=httpx.Limits(max_keepalive_connections=0)) as client:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    results = await client.get("/results", params={"sort_by": "trust_score", "page_size": 5})
+                    status = await client.get("/status")
+                    etags.add(results.headers.get("etag"))
+                    pids.add(status.json()["worker_pid"])
+                    current_jobs.add(status.json()["current_analysis"])
+                    latencies.append(time.perf_counter() - started)
+                except httpx.HTTPError:
+                    errors += 1
+
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+
+    latencies.sort()
+    return {
+        "requests": len(latencies) * 2,
+        "throughput": len(latencies) * 2 / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+        "errors": errors,
+        "etags": etags,
+        "pids": pids,
+        "current_jobs": current_jobs
+    }
+
+
+def benchmark(workers: int, port: int, config_path: str, duration: float, concurrency: int) -> dict:
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(port, workers, config_path)
+    try:
+        wait_until_healthy(base_url)
+        stats = asyncio.run(run_load(base_url, duration, concurrency))
+
+        # Switch the shared current analysis and confirm every worker follows it
+        switch_job_id = f"benchmark-{workers}-switch"
+        with open(config_path, "r", encoding="utf-8") as f:
+            publish_job(json.load(f), switch_job_id)
+        after = asyncio.run(run_load(base_url, 1.0, concurrency))
+        stats["consistent_after_switch"] = after["current_jobs"] == {switch_job_id} and len(after["etags"]) == 1
+        return stats
+    finally:
+        server.terminate()
+        server.wait(timeout=15)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    scratch_dir = tempfile.mkdtemp(prefix="idk-bench-")
+    try:
+        config_path = prepare_scratch_config(scratch_dir)
+
+        print("=" * 60)
+        print("MULTI-WORKER BENCHMARK")
+        print("=" * 60)
+        for workers in sorted({1, args.workers}):
+            stats = benchmark(workers, args.port, config_path, args.duration, args.concurrency)
+            print(f"\nWorkers: {workers}")
+            print(f"  Requests: {stats['requests']} ({stats['throughput']:.0f} req/s)")
+            print(f"  Latency p50/p95: {stats['p50_ms']:.1f} / {stats['p95_ms']:.1f} ms per /results + /status pair")
+            print(f"  Errors: {stats['errors']}")
+            print(f"  Worker processes seen: {len(stats['pids'])}")
+            print(f"  Distinct /results ETags: {len(stats['etags'])}")
+            print(f"  All workers switched to new analysis: {stats['consistent_after_switch']}")
+        print("=" * 60)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
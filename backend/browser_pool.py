@@ -0,0 +1,130 @@
+"""
+Pool of headless Chrome sessions shared by concurrent extractions, with health checks and replacement
+"""
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# WebDriver errors that mean the browser session itself is gone, not just this page
+SESSION_LOST_MARKERS = ('disconnected', 'no such session', 'invalid session id', 'chrome not reachable', 'session deleted', 'crash')
+
+
+def new_driver():
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument(f'user-agent={BROWSER_USER_AGENT}')
+    chrome_options.add_argument('--log-level=3')
+    return webdriver.Chrome(options=chrome_options)
+
+
+def is_session_lost(error: BaseException) -> bool:
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    if isinstance(error, TimeoutException) or not isinstance(error, WebDriverException):
+        return False
+    message = str(error).lower()
+    return any(marker in message for marker in SESSION_LOST_MARKERS)
+
+
+class BrowserPool:
+    """Starts one browser up front and more on demand, up to size; dead sessions are discarded and replaced"""
+
+    def __init__(self, size: int = 3):
+        self.size = max(1, size)
+        self.drivers: List[Any] = []
+        self.idle: queue.Queue = queue.Queue()
+        self.replaced = 0
+        self._lock = threading.Lock()
+        try:
+            self.idle.put(self._start())
+            print("Selenium WebDriver initialized successfully\n")
+        except Exception as e:
+            print(f"Warning: Could not initialize Selenium WebDriver: {str(e)}")
+            print("Content extraction will be skipped\n")
+
+    @property
+    def available(self) -> bool:
+        return bool(self.drivers)
+
+    def _start(self):
+        driver = new_driver()
+        self.drivers.append(driver)
+        return driver
+
+    def acquire(self) -> Optional[Any]:
+        """A browser for one page load, or None once no browser is left running"""
+        while True:
+            try:
+                return self.idle.get(timeout=1.0)
+            except queue.Empty:
+                pass
+            with self._lock:
+                if len(self.drivers) < self.size:
+                    try:
+                        return self._start()
+                    except Exception as e:
+                        print(f"Warning: Could not start another browser: {str(e)[:100]}")
+                if not self.drivers:
+                    return None
+
+    def release(self, driver: Any, healthy: bool = True) -> None:
+        if healthy:
+            self.idle.put(driver)
+        else:
+            self._discard(driver)
+
+    def _discard(self, driver: Any) -> None:
+        with self._lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+                self.replaced += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def check_health(self) -> Dict[str, Any]:
+        """Ping every idle browser, discard the dead ones, and start one again if none is running"""
+        idle = []
+        while True:
+            try:
+                idle.append(self.idle.get_nowait())
+            except queue.Empty:
+                break
+        for driver in idle:
+            try:
+                driver.execute_script('return 1')
+                self.idle.put(driver)
+            except Exception:
+                self._discard(driver)
+
+        with self._lock:
+            if not self.drivers:
+                try:
+                    self.idle.put(self._start())
+                except Exception:
+                    pass
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'size': self.size, 'running': len(self.drivers), 'idle': self.idle.qsize(), 'replaced': self.replaced}
+
+    def close(self) -> None:
+        with self._lock:
+            drivers, self.drivers = self.drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,68 @@
+"""
+Write-ahead log of finished work units so an interrupted analysis resumes instead of starting over
+"""
+import json
+import os
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+
+class RunCheckpoint:
+    """
+    Units are keyed tuples such as ('search', file, item) or ('link', file, item, position).
+    Each finished unit is appended as one fsync'd JSON line; a torn trailing line is ignored on load.
+    Without a path the checkpoint only lives in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None, fingerprint: str = '', resume: bool = False):
+        self.path = path
+        self.units: Dict[Tuple, Any] = {}
+        self.reused = 0
+        if path is None:
+            return
+
+        if resume:
+            self.units = self._load(path, fingerprint)
+        if not self.units:
+            # The header ties the log to the exact inputs and config it was written for
+            tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'fingerprint': fingerprint}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+    @staticmethod
+    def _load(path: str, fingerprint: str) -> Dict[Tuple, Any]:
+        units = {}
+        if not os.path.exists(path):
+            return units
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline()
+            try:
+                if json.loads(header).get('fingerprint') != fingerprint:
+                    return units
+            except json.JSONDecodeError:
+                return units
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                units[tuple(record['unit'])] = record['data']
+        return units
+
+    def get(self, *unit: Any) -> Optional[Any]:
+        data = self.units.get(unit)
+        if data is not None:
+            self.reused += 1
+        return data
+
+    def record(self, *unit: Any, data: Any) -> None:
+        self.units[unit] = data
+        if self.path is None:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'unit': list(unit), 'data': data}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,132 @@
+"""
+Per-dependency circuit breakers so an outage fails fast instead of timing out item by item
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str):
+        super().__init__(f"circuit '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: float = 30.0
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.outcomes = deque(maxlen=window_size)
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True if a call may go out; in half-open state only a single probe is let through"""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def release(self) -> None:
+        """Give back a half-open probe whose call never went out"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self.outcomes.clear()
+            self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.outcomes.append(False)
+            if self.state == self.HALF_OPEN or self._failure_rate() >= self.failure_rate:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.probe_in_flight = False
+
+    def _failure_rate(self) -> float:
+        if len(self.outcomes) < self.min_calls:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = round(max(0.0, self.open_seconds - (time.monotonic() - self.opened_at)), 1)
+            return {
+                'state': self.state,
+                'window_calls': len(self.outcomes),
+                'window_failure_rate': round(self._failure_rate(), 3),
+                'rejected_calls': self.rejected,
+                'retry_in_seconds': retry_in
+            }
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers, so a dependency found down by one run stays open for the next"""
+
+    def __init__(self):
+        self.settings: Dict[str, Any] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, settings: Optional[Dict[str, Any]]) -> None:
+        """Thresholds from circuit_breaker_settings; breakers created earlier keep their current state"""
+        with self._lock:
+            self.settings = dict(settings or {})
+            for breaker in self.breakers.values():
+                self._apply(breaker)
+
+    def _apply(self, breaker: CircuitBreaker) -> None:
+        breaker.min_calls = self.settings.get('min_calls', breaker.min_calls)
+        breaker.failure_rate = self.settings.get('failure_rate', breaker.failure_rate)
+        breaker.open_seconds = self.settings.get('open_seconds', breaker.open_seconds)
+        window_size = self.settings.get('window_size', breaker.outcomes.maxlen)
+        if window_size != breaker.outcomes.maxlen:
+            breaker.outcomes = deque(breaker.outcomes, maxlen=window_size)
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name)
+                self._apply(self.breakers[name])
+            return self.breakers[name]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self.breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+breakers = CircuitBreakerRegistry()
@@ -0,0 +1,86 @@
+"""
+Cheap local convergence signal for a debate, consulted before spending a Gemini call on the readiness check
+"""
+import re
+from typing import Any, Dict, List, Set, Tuple
+
+from domain_trust import registrable_domain
+from text_utils import jaccard, token_set
+
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+SOURCE_RE = re.compile(r"\b(?:https?://)?((?:[a-z0-9-]+\.)+[a-z]{2,})\b")
+SHINGLE_SIZE = 3
+
+# Blend of the three signals; lexical novelty is the most direct sign that a round added nothing
+NOVELTY_WEIGHT = 0.5
+REPETITION_WEIGHT = 0.3
+SOURCE_WEIGHT = 0.2
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[Tuple[str, ...]]:
+    words = WORD_RE.findall(text.lower())
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def cited_sources(text: str) -> Set[str]:
+    return {registrable_domain(host) for host in SOURCE_RE.findall(text.lower())}
+
+
+class ConvergenceDetector:
+    def __init__(self, enabled: bool = True, ready_above: float = 0.75, continue_below: float = 0.45):
+        # Disabled still scores every round, so the LLM's answers can be logged against the signal for calibration
+        self.enabled = enabled
+        self.ready_above = ready_above
+        self.continue_below = continue_below
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ConvergenceDetector':
+        settings = config.get('convergence_settings', {})
+        return cls(
+            enabled=settings.get('enabled', True),
+            ready_above=settings.get('ready_above', 0.75),
+            continue_below=settings.get('continue_below', 0.45)
+        )
+
+    def assess(self, turns: List[Tuple[str, str]], latest: int = 2) -> Dict[str, Any]:
+        """
+        turns is the (speaker, text) sequence so far; the last `latest` turns are the round being judged.
+        Returns the signals, a 0-1 convergence score and a decision: 'ready', 'continue' or 'inconclusive'.
+        """
+        recent, prior = turns[-latest:], turns[:-latest]
+        prior_words = set().union(*(token_set(text) for _, text in prior)) if prior else set()
+        recent_words = set().union(*(token_set(text) for _, text in recent)) if recent else set()
+        novelty = len(recent_words - prior_words) / len(recent_words) if recent_words else 0.0
+
+        # Each new turn against the closest earlier turn, so restating an opening counts as repetition
+        prior_shingles = [shingles(text) for _, text in prior]
+        repetition = sum(
+            max((jaccard(shingles(text), earlier) for earlier in prior_shingles), default=0.0)
+            for _, text in recent
+        ) / len(recent) if recent else 0.0
+
+        prior_sources = set().union(*(cited_sources(text) for _, text in prior)) if prior else set()
+        recent_sources = set().union(*(cited_sources(text) for _, text in recent)) if recent else set()
+        new_sources = recent_sources - prior_sources
+        source_novelty = len(new_sources) / len(recent_sources) if recent_sources else 0.0
+
+        score = (
+            NOVELTY_WEIGHT * (1 - novelty)
+            + REPETITION_WEIGHT * repetition
+            + SOURCE_WEIGHT * (1 - source_novelty)
+        )
+        if score >= self.ready_above:
+            decision = 'ready'
+        elif score <= self.continue_below:
+            decision = 'continue'
+        else:
+            decision = 'inconclusive'
+
+        return {
+            'score': round(score, 4),
+            'decision': decision,
+            'lexical_novelty': round(novelty, 4),
+            'repetition': round(repetition, 4),
+            'new_sources': len(new_sources)
+        }
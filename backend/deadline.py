@@ -0,0 +1,31 @@
+"""
+Run-wide time budget handed down to every stage so each call gets only the time that is left
+"""
+import time
+from typing import Optional
+
+
+class Deadline:
+    def __init__(self, seconds: Optional[float] = None):
+        # No budget (None or 0) means the run is unbounded and every timeout keeps its default
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def timeout(self, default: float, minimum: float = 0.1) -> float:
+        """Per-call timeout: the stage default, capped by what is left of the budget"""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(minimum, min(default, remaining))
+
+    def sleep(self, seconds: float) -> None:
+        remaining = self.remaining()
+        time.sleep(seconds if remaining is None else min(seconds, remaining))
@@ -1,49 +1,75 @@
 import json
 import google.generativeai as genai
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+from convergence import ConvergenceDetector
+from llm_gate import FairLLMGate, GatedModel
+from result_store import ResultStore
+from workspace import Workspace
+
+
+CONTENT_PREVIEW_CHARS = 300
 
 
 class DebateAgent:
-    def __init__(self, name: str, role: str, knowledge_files: List[str], api_key: str):
+    def __init__(
+        self,
+        name: str,
+        role: str,
+        knowledge_files: List[str],
+        api_key: str,
+        knowledge_documents: Optional[List[Dict[str, Any]]] = None
+    ):
         self.name = name
         self.role = role
-        self.knowledge = self._load_knowledge(knowledge_files)
+        if knowledge_documents is not None:
+            self.knowledge = self._format_knowledge(knowledge_documents)
+        else:
+            self.knowledge = self._load_knowledge(knowledge_files)
         
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model_name="gemini-2.0-flash")
     
     def _load_knowledge(self, knowledge_files: List[str]) -> str:
-        combined_knowledge = []
+        documents = []
         
         for file_path in knowledge_files:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    file_info = f"\n=== Knowledge from {data['source_file']} ===\n"
-                    file_info += f"Topic: {data['topic']}\n\n"
-                    
-                    for item in data['items']:
-                        file_info += f"Statement: {item['text']}\n"
-                        file_info += f"Bias: {item['bias_x']}, Significance: {item['significance_y']}\n"
-                        
-                        if item['relevant_links']:
-                            file_info += "Supporting Evidence:\n"
-                            for link in item['relevant_links']:
-                                file_info += f"  - {link['title']}\n"
-                                file_info += f"    URL: {link['link']}\n"
-                                file_info += f"    Trust Score: {link['trust_score']} ({link['source_type']})\n"
-                                file_info += f"    Snippet: {link['snippet']}\n"
-                                if 'extracted_content' in link:
-                                    content_preview = link['extracted_content'][:300]
-                                    file_info += f"    Content: {content_preview}...\n"
-                                file_info += "\n"
-                        file_info += "\n"
-                    
-                    combined_knowledge.append(file_info)
+                    documents.append(json.load(f))
             except Exception as e:
                 print(f"Error loading {file_path}: {e}")
         
+        return self._format_knowledge(documents)
+    
+    def _format_knowledge(self, documents: List[Dict[str, Any]]) -> str:
+        combined_knowledge = []
+        
+        for data in documents:
+            file_info = f"\n=== Knowledge from {data['source_file']} ===\n"
+            file_info += f"Topic: {data['topic']}\n\n"
+            
+            for item in data['items']:
+                file_info += f"Statement: {item['text']}\n"
+                file_info += f"Bias: {item['bias_x']}, Significance: {item['significance_y']}\n"
+                
+                if item['relevant_links']:
+                    file_info += "Supporting Evidence:\n"
+                    for link in item['relevant_links']:
+                        file_info += f"  - {link['title']}\n"
+                        file_info += f"    URL: {link['link']}\n"
+                        file_info += f"    Trust Score: {link['trust_score']} ({link['source_type']})\n"
+                        if link.get('mirror_count'):
+                            file_info += f"    Also published at {link['mirror_count']} other URLs\n"
+                        file_info += f"    Snippet: {link['snippet']}\n"
+                        if 'extracted_content' in link:
+                            content_preview = link['extracted_content'][:CONTENT_PREVIEW_CHARS]
+                            file_info += f"    Content: {content_preview}...\n"
+                        file_info += "\n"
+                file_info += "\n"
+            
+            combined_knowledge.append(file_info)
+        
         return "\n".join(combined_knowledge)
     
     def make_argument(self, topic: str, debate_context: str = "") -> str:
@@ -186,34 +212,66 @@ Your judgment:"""
 
 
 class DebateOrchestrator:
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(
+        self,
+        config_path: str = "config.json",
+        workspace: Optional[Workspace] = None,
+        llm_gate: Optional[FairLLMGate] = None,
+        gate_owner: Optional[str] = None
+    ):
         with open(config_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
         
         api_key = config['api_key']
         
-        with open('data/input.json', 'r', encoding='utf-8') as f:
-            input_data = json.load(f)
+        self.workspace = workspace or Workspace()
+        input_data = self.workspace.load_input()
         
         self.topic = input_data['topic']
         
+        # Job runs are read from the result store; the legacy layout falls back to relevant_*.json
+        store = ResultStore.from_config(config)
+        self.store = store
+        self.topic_id = store.latest_topic_id(job_id=self.workspace.job_id) if self.workspace.job_id else None
+        
         self.leftist = DebateAgent(
             name="Leftist Agent",
             role="analyst with access to leftist-leaning sources",
-            knowledge_files=['relevant_common.json', 'relevant_leftist.json'],
-            api_key=api_key
+            knowledge_files=[self.workspace.relevant_path('common'), self.workspace.relevant_path('leftist')],
+            api_key=api_key,
+            knowledge_documents=self._stored_knowledge(store, ['common', 'leftist'])
         )
         
         self.rightist = DebateAgent(
             name="Rightist Agent",
             role="analyst with access to rightist-leaning sources",
-            knowledge_files=['relevant_common.json', 'relevant_rightist.json'],
-            api_key=api_key
+            knowledge_files=[self.workspace.relevant_path('common'), self.workspace.relevant_path('rightist')],
+            api_key=api_key,
+            knowledge_documents=self._stored_knowledge(store, ['common', 'rightist'])
         )
         
         self.judge = JudgeAgent(api_key=api_key)
         
+        # Concurrent debates share one Gemini concurrency cap, taking turns per debate
+        if llm_gate is not None:
+            owner = gate_owner or self.workspace.job_id or 'default'
+            for agent in (self.leftist, self.rightist, self.judge):
+                agent.model = GatedModel(agent.model, llm_gate, owner)
+        
+        self.convergence = ConvergenceDetector.from_config(config)
+        self.convergence_log = []
         self.debate_transcript = []
+        # (speaker, text) per turn, for the local convergence signal
+        self.turns = []
+    
+    def _stored_knowledge(self, store: ResultStore, perspectives: List[str]) -> Optional[List[Dict[str, Any]]]:
+        if self.topic_id is None:
+            return None
+        documents = [
+            store.export_document(self.topic_id, perspective, content_chars=CONTENT_PREVIEW_CHARS)
+            for perspective in perspectives
+        ]
+        return [document for document in documents if document is not None]
     
     def check_if_debate_ready_for_conclusion(self, debate_history: str) -> Dict[str, any]:
         """Check if the debate has reached sufficient depth for a conclusion."""
@@ -262,6 +320,21 @@ Your assessment:"""
             print(f"Error checking debate readiness: {e}")
             return {'ready': False, 'full_response': f"Error: {e}"}
     
+    def _is_ready(self, round_num: int, debate_history: str) -> bool:
+        """Local convergence signal first; the Gemini readiness check only when it is inconclusive"""
+        signal = self.convergence.assess(self.turns)
+        llm_ready = None
+        if self.convergence.enabled and signal['decision'] != 'inconclusive':
+            ready = signal['decision'] == 'ready'
+            print(f"Local convergence signal: {signal['decision']} (score {signal['score']})")
+        else:
+            readiness = self.check_if_debate_ready_for_conclusion(debate_history)
+            print(readiness['full_response'])
+            ready = llm_ready = readiness['ready']
+        
+        self.convergence_log.append({'round': round_num, **signal, 'llm_ready': llm_ready, 'ready': ready})
+        return ready
+    
     def conduct_debate(self, max_rounds: int = 5, min_rounds: int = 1):
         print("="*70)
         print("DEBATE: INFORMATION TRUSTWORTHINESS ANALYSIS")
@@ -273,12 +346,14 @@ Your assessment:"""
         leftist_opening = self.leftist.make_argument(self.topic)
         print(leftist_opening)
         self.debate_transcript.append(f"LEFTIST OPENING:\n{leftist_opening}\n")
+        self.turns.append(('leftist', leftist_opening))
         
         print("\n" + "="*70)
         print("\n[RIGHTIST AGENT - Opening Statement]\n")
         rightist_opening = self.rightist.make_argument(self.topic)
         print(rightist_opening)
         self.debate_transcript.append(f"RIGHTIST OPENING:\n{rightist_opening}\n")
+        self.turns.append(('rightist', rightist_opening))
         
         debate_history = "\n\n".join(self.debate_transcript)
         
@@ -298,6 +373,7 @@ Your assessment:"""
             )
             print(leftist_response)
             self.debate_transcript.append(f"LEFTIST ROUND {round_num}:\n{leftist_response}\n")
+            self.turns.append(('leftist', leftist_response))
             debate_history = "\n\n".join(self.debate_transcript)
             
             print("\n" + "="*70)
@@ -310,6 +386,7 @@ Your assessment:"""
             )
             print(rightist_response)
             self.debate_transcript.append(f"RIGHTIST ROUND {round_num}:\n{rightist_response}\n")
+            self.turns.append(('rightist', rightist_response))
             debate_history = "\n\n".join(self.debate_transcript)
             
             # Check if debate is ready for conclusion (after minimum rounds)
@@ -317,10 +394,7 @@ Your assessment:"""
                 print("\n" + "="*70)
                 print("\n[Checking if debate is ready for conclusion...]\n")
                 
-                readiness = self.check_if_debate_ready_for_conclusion(debate_history)
-                print(readiness['full_response'])
-                
-                if readiness['ready']:
+                if self._is_ready(round_num, debate_history):
                     print("\n✓ Debate has reached sufficient depth. Proceeding to verdict.\n")
                     break
                 else:
@@ -343,13 +417,15 @@ Your assessment:"""
             'topic': self.topic,
             'debate_transcript': self.debate_transcript,
             'trust_score': judgment['trust_score'],
-            'judgment': judgment['full_judgment']
+            'judgment': judgment['full_judgment'],
+            'convergence_log': self.convergence_log
         }
         
-        with open('debate_result.json', 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        self.store.record_convergence_decisions(self.workspace.job_id, self.convergence_log)
+        
+        self.workspace.write_json(self.workspace.debate_result_path, result)
         
-        print(f"\n✓ Debate result saved to debate_result.json")
+        print(f"\n✓ Debate result saved to {self.workspace.debate_result_path}")
         print(f"✓ Final Trust Score: {judgment['trust_score']}%")
         
         return result
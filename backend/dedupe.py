@@ -0,0 +1,66 @@
+"""
+SimHash near-duplicate detection with a banded LSH index, for syndicated copies of the same article
+"""
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+WORD_RE = re.compile(r"\w+")
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> Optional[int]:
+    """64-bit SimHash over word shingles; None when the text is too short to fingerprint"""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < shingle_size:
+        return None
+    weights = [0] * FINGERPRINT_BITS
+    for i in range(len(words) - shingle_size + 1):
+        shingle = ' '.join(words[i:i + shingle_size])
+        # Stable across processes, unlike hash(), so fingerprints agree between runs and workers
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+class NearDuplicateIndex:
+    """
+    Fingerprints split into max_distance + 1 bands: two fingerprints within max_distance bits agree
+    exactly on at least one band, so only entries sharing a band bucket are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.bands
+        self.buckets: Dict[Tuple[int, int], List[Tuple[int, Any]]] = {}
+
+    def _band_keys(self, fingerprint: int):
+        mask = (1 << self.band_bits) - 1
+        for band in range(self.bands):
+            yield band, fingerprint >> (band * self.band_bits) & mask
+
+    def match(self, fingerprint: Optional[int]) -> Optional[Any]:
+        """Key of the closest indexed fingerprint within max_distance, if any"""
+        if fingerprint is None:
+            return None
+        best = None
+        for band_key in self._band_keys(fingerprint):
+            for other, key in self.buckets.get(band_key, ()):
+                distance = hamming(fingerprint, other)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, key)
+        return best[1] if best else None
+
+    def add(self, fingerprint: Optional[int], key: Any) -> None:
+        if fingerprint is None:
+            return
+        for band_key in self._band_keys(fingerprint):
+            self.buckets.setdefault(band_key, []).append((fingerprint, key))
@@ -0,0 +1,155 @@
+"""
+Deterministic domain trust priors so known sources skip the Gemini trust call
+"""
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Public suffixes with two labels that appear in our sources; anything else is treated as single-label
+MULTI_PART_SUFFIXES = {
+    'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au',
+    'co.nz', 'co.in', 'gov.in', 'ac.in', 'co.jp', 'com.br', 'gc.ca'
+}
+
+# Mirrors the fixed rules in the check_trust_score prompt: (trust_score, source_type)
+SUFFIX_PRIORS: Dict[str, Tuple[float, str]] = {
+    'gov': (0.92, 'Government'),
+    'mil': (0.9, 'Government'),
+    'edu': (0.9, 'Academic'),
+    'gov.uk': (0.92, 'Government'),
+    'ac.uk': (0.9, 'Academic'),
+    'gov.au': (0.92, 'Government'),
+    'edu.au': (0.9, 'Academic'),
+    'gc.ca': (0.92, 'Government'),
+    'gov.in': (0.9, 'Government'),
+    'ac.in': (0.88, 'Academic')
+}
+
+DOMAIN_PRIORS: Dict[str, Tuple[float, str]] = {
+    'facebook.com': (0.3, 'Social Media'),
+    'instagram.com': (0.3, 'Social Media'),
+    'twitter.com': (0.3, 'Social Media'),
+    'x.com': (0.3, 'Social Media'),
+    'tiktok.com': (0.25, 'Social Media'),
+    'reddit.com': (0.3, 'Social Media'),
+    'threads.net': (0.3, 'Social Media'),
+    'youtube.com': (0.35, 'Social Media'),
+    'linkedin.com': (0.35, 'Social Media'),
+    'nytimes.com': (0.9, 'News Media'),
+    'wsj.com': (0.9, 'News Media'),
+    'washingtonpost.com': (0.88, 'News Media'),
+    'bbc.com': (0.9, 'News Media'),
+    'bbc.co.uk': (0.9, 'News Media'),
+    'reuters.com': (0.93, 'News Media'),
+    'apnews.com': (0.93, 'News Media'),
+    'npr.org': (0.88, 'News Media'),
+    'pbs.org': (0.88, 'News Media'),
+    'theguardian.com': (0.86, 'News Media'),
+    'thenation.com': (0.8, 'News Media'),
+    'politico.com': (0.85, 'News Media'),
+    'bloomberg.com': (0.88, 'News Media'),
+    'economist.com': (0.88, 'News Media'),
+    'ft.com': (0.88, 'News Media'),
+    'cnn.com': (0.82, 'News Media'),
+    'foxnews.com': (0.8, 'News Media'),
+    'nbcnews.com': (0.85, 'News Media'),
+    'cbsnews.com': (0.85, 'News Media'),
+    'abcnews.go.com': (0.85, 'News Media'),
+    'usatoday.com': (0.82, 'News Media'),
+    'latimes.com': (0.85, 'News Media'),
+    'wikipedia.org': (0.75, 'Encyclopedia'),
+    'britannica.com': (0.85, 'Encyclopedia'),
+    'medium.com': (0.3, 'Blog'),
+    'substack.com': (0.35, 'Blog'),
+    'blogspot.com': (0.2, 'Blog'),
+    'wordpress.com': (0.2, 'Blog')
+}
+
+
+def host_of(url: str) -> str:
+    host = urlsplit(url if '//' in url else f'//{url}').hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+
+def registrable_domain(host: str) -> str:
+    labels = host.split('.')
+    if len(labels) >= 3 and '.'.join(labels[-2:]) in MULTI_PART_SUFFIXES:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+class DomainTrustTable:
+    def __init__(
+        self,
+        user_priors: Optional[Dict[str, Dict[str, Any]]] = None,
+        learned: Optional[Dict[str, Dict[str, Any]]] = None,
+        min_observations: int = 3
+    ):
+        # User entries override the built-in table; both accept a full host, a registrable domain or a suffix
+        self.user_priors = {
+            domain.lower(): (entry['trust_score'], entry.get('source_type', 'Unknown'))
+            for domain, entry in (user_priors or {}).items()
+        }
+        self.learned = dict(learned or {})
+        self.min_observations = min_observations
+
+    def _candidates(self, host: str):
+        """The host itself, then each parent domain down to the registrable domain"""
+        registrable = registrable_domain(host)
+        labels = host.split('.')
+        for start in range(len(labels)):
+            candidate = '.'.join(labels[start:])
+            yield candidate
+            if candidate == registrable:
+                return
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        host = host_of(url)
+        if not host:
+            return None
+
+        for table, rule in ((self.user_priors, 'configured'), (DOMAIN_PRIORS, 'built-in')):
+            for candidate in self._candidates(host):
+                if candidate in table:
+                    score, source_type = table[candidate]
+                    return self._prior(score, source_type, f'{rule} domain prior for {candidate}')
+
+        labels = host.split('.')
+        for suffix in ('.'.join(labels[-2:]), labels[-1]):
+            if suffix in self.user_priors:
+                score, source_type = self.user_priors[suffix]
+                return self._prior(score, source_type, f'configured suffix prior for .{suffix}')
+            if suffix in SUFFIX_PRIORS:
+                score, source_type = SUFFIX_PRIORS[suffix]
+                return self._prior(score, source_type, f'built-in suffix prior for .{suffix}')
+
+        learned = self.learned.get(registrable_domain(host))
+        if learned and learned['observations'] >= self.min_observations:
+            score = round(learned['score_sum'] / learned['observations'], 2)
+            return self._prior(
+                score,
+                learned['source_type'],
+                f"learned prior for {registrable_domain(host)} from {learned['observations']} Gemini scores"
+            )
+
+        return None
+
+    def observe(self, url: str, trust_result: Dict[str, Any]) -> Optional[str]:
+        """Fold an LLM trust score into the in-memory learned table; returns the domain it was filed under"""
+        host = host_of(url)
+        if not host:
+            return None
+        domain = registrable_domain(host)
+        entry = self.learned.setdefault(domain, {'observations': 0, 'score_sum': 0.0, 'source_type': 'Unknown'})
+        entry['observations'] += 1
+        entry['score_sum'] += float(trust_result.get('trust_score', 0.5))
+        entry['source_type'] = trust_result.get('source_type', entry['source_type'])
+        return domain
+
+    @staticmethod
+    def _prior(score: float, source_type: str, reasoning: str) -> Dict[str, Any]:
+        return {
+            'trust_score': score,
+            'source_type': source_type,
+            'trust_reasoning': f'Deterministic {reasoning}'
+        }
@@ -1,5 +1,6 @@
 """
 Simplified dummy server for testing - serves sample data from relevant_*.json files
+through the embedded result store
 Runs on port 8001 to simulate external data source
 """
 from fastapi import FastAPI, HTTPException
@@ -9,6 +10,8 @@ import os
 import uvicorn
 from datetime import datetime
 
+from result_store import ResultStore
+
 app = FastAPI(title="Dummy Data Server for Testing")
 
 # Add CORS middleware
@@ -20,12 +23,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load data on startup
-relevant_data = {"common": [], "leftist": [], "rightist": []}
+DUMMY_JOB_ID = "dummy-server"
+
+with open("config.json", "r", encoding="utf-8") as f:
+    store = ResultStore.from_config(json.load(f))
+
+# Topic id of the imported sample data and per-perspective statement counts
+topic_id = None
+statement_counts = {"common": 0, "leftist": 0, "rightist": 0}
 
 def load_data():
-    """Load data from relevant JSON files"""
-    global relevant_data
+    """Import the relevant JSON files into the result store once; requests then query it directly"""
+    global topic_id, statement_counts
     
     files = {
         "common": "relevant_common.json",
@@ -34,32 +43,33 @@ def load_data():
     }
     
     for perspective, filename in files.items():
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                    items = file_data.get('items', [])
-                    relevant_data[perspective] = items
-                    print(f"✓ Loaded {len(items)} items from {filename}")
-            except Exception as e:
-                print(f"✗ Error loading {filename}: {e}")
-                relevant_data[perspective] = []
-        else:
-            print(f"✗ File {filename} not found")
-            relevant_data[perspective] = []
+        if not os.path.exists(filename):
+            print(f"File {filename} not found")
+    
+    try:
+        topic_id = store.import_json_files(files, job_id=DUMMY_JOB_ID)
+    except Exception as e:
+        print(f"Error importing relevant files: {e}")
+        topic_id = None
     
-    total = sum(len(items) for items in relevant_data.values())
-    print(f"📊 Total items loaded: {total}")
+    counts = store.statement_counts(topic_id) if topic_id is not None else {}
+    statement_counts = {perspective: counts.get(perspective, 0) for perspective in files}
+    print(f"Total items loaded: {sum(statement_counts.values())}")
 
 # Load data when server starts
 load_data()
 
+def query_search_items(perspective: str = None):
+    if topic_id is None:
+        return []
+    return store.search_items(topic_id, perspective)
+
 @app.get("/")
 async def root():
     return {
         "server": "Dummy Data Server",
         "purpose": "Testing Information Trust Analysis System",
-        "total_items": sum(len(items) for items in relevant_data.values())
+        "total_items": sum(statement_counts.values())
     }
 
 @app.get("/data/sample-input")
@@ -74,36 +84,14 @@ async def get_sample_input():
 @app.get("/data/perspectives/all")
 async def get_all_perspectives():
     """Get data from all perspectives combined - MUST be defined before /{perspective} route"""
-    all_data = {}
-    combined_search_items = []
+    combined_search_items = query_search_items()
     
-    for perspective in ["common", "leftist", "rightist"]:
-        items = relevant_data[perspective]
-        search_items = []
-        
-        for item in items:
-            if item.get('relevant_links'):
-                for link in item['relevant_links']:
-                    search_item = {
-                        "text": item.get('text', ''),
-                        "bias_x": item.get('bias_x', 0.5),
-                        "significance_y": item.get('significance_y', 0.5),
-                        "combined_score": item.get('combined_score', 0.25),
-                        "link_title": link.get('title', ''),
-                        "link_url": link.get('link', ''),
-                        "link_snippet": link.get('snippet', ''),
-                        "trust_score": link.get('trust_score', 0.5),
-                        "source_type": link.get('source_type', 'Unknown'),
-                        "perspective": perspective
-                    }
-                    search_items.append(search_item)
-                    combined_search_items.append(search_item)
-        
-        all_data[perspective] = {
-            "perspective": perspective,
-            "total_items": len(items),
-            "search_items": search_items
-        }
+    all_data = {
+        perspective: {"perspective": perspective, "total_items": count, "search_items": []}
+        for perspective, count in statement_counts.items()
+    }
+    for search_item in combined_search_items:
+        all_data[search_item["perspective"]]["search_items"].append(search_item)
     
     return {
         "perspectives": all_data,
@@ -115,32 +103,13 @@ async def get_all_perspectives():
 @app.get("/data/perspectives/{perspective}")
 async def get_perspective_data(perspective: str):
     """Get data for a specific perspective - MUST be defined after /all route"""
-    if perspective not in relevant_data:
+    if perspective not in statement_counts:
         raise HTTPException(status_code=404, detail=f"Perspective '{perspective}' not found")
     
-    items = relevant_data[perspective]
-    search_items = []
-    
-    for item in items:
-        if item.get('relevant_links'):
-            for link in item['relevant_links']:
-                search_items.append({
-                    "text": item.get('text', ''),
-                    "bias_x": item.get('bias_x', 0.5),
-                    "significance_y": item.get('significance_y', 0.5),
-                    "combined_score": item.get('combined_score', 0.25),
-                    "link_title": link.get('title', ''),
-                    "link_url": link.get('link', ''),
-                    "link_snippet": link.get('snippet', ''),
-                    "trust_score": link.get('trust_score', 0.5),
-                    "source_type": link.get('source_type', 'Unknown'),
-                    "perspective": perspective
-                })
-    
     return {
         "perspective": perspective,
-        "total_items": len(items),
-        "search_items": search_items,
+        "total_items": statement_counts[perspective],
+        "search_items": query_search_items(perspective),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -148,14 +117,14 @@ async def get_perspective_data(perspective: str):
 async def health():
     return {
         "status": "healthy",
-        "loaded_perspectives": list(relevant_data.keys()),
-        "total_items": sum(len(items) for items in relevant_data.values())
+        "loaded_perspectives": list(statement_counts.keys()),
+        "total_items": sum(statement_counts.values())
     }
 
 @app.post("/reload")
 async def reload():
     load_data()
-    return {"message": "Data reloaded", "total_items": sum(len(items) for items in relevant_data.values())}
+    return {"message": "Data reloaded", "total_items": sum(statement_counts.values())}
 
 if __name__ == "__main__":
     print("Starting Dummy Data Server on port 8001")
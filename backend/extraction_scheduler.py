@@ -0,0 +1,114 @@
+"""
+Page extraction scheduler: many loads in flight overall, but each individual host is visited politely
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+def host_key(url: str) -> str:
+    """Host with port, so fixture servers on different ports of one machine count as different sites"""
+    netloc = urlsplit(url).netloc.lower().rsplit('@', 1)[-1]
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+class PoliteScheduler:
+    """
+    Tasks queue per host; worker threads (up to `workers`) take them round-robin across hosts, never
+    running more than per_host_concurrency at once on a host nor starting two on the same host
+    within min_host_interval seconds of each other.
+    """
+
+    def __init__(self, workers: int = 3, per_host_concurrency: int = 1, min_host_interval: float = 1.0):
+        self.workers = max(1, workers)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.min_host_interval = min_host_interval
+        # Hosts in turn order; a host that was just served moves to the back
+        self.pending: 'OrderedDict[str, deque]' = OrderedDict()
+        self.active: Dict[str, int] = {}
+        self.last_start: Dict[str, float] = {}
+        self.threads = []
+        self.closed = False
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'PoliteScheduler':
+        settings = config.get('extraction_settings', {})
+        return cls(
+            workers=settings.get('workers', 3),
+            per_host_concurrency=settings.get('per_host_concurrency', 1),
+            min_host_interval=settings.get('min_host_interval_seconds', 1.0)
+        )
+
+    def submit(self, url: str, fn: Callable[..., Any], *args: Any) -> Future:
+        future = Future()
+        with self._cond:
+            if self.closed:
+                raise RuntimeError("scheduler is shut down")
+            self.pending.setdefault(host_key(url), deque()).append((future, fn, args))
+            if len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"extract-{len(self.threads)}", daemon=True)
+                self.threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return future
+
+    def _next_task(self) -> Tuple[Optional[str], Optional[tuple], Optional[float]]:
+        """With the lock held: the next host and task allowed to start, else how long until one may"""
+        now = time.monotonic()
+        soonest = None
+        for host in list(self.pending):
+            # Tasks cancelled by their run cost the host neither a slot nor its spacing
+            tasks = self.pending[host]
+            while tasks and tasks[0][0].cancelled():
+                tasks.popleft()
+            if not tasks:
+                del self.pending[host]
+                continue
+            if self.active.get(host, 0) >= self.per_host_concurrency:
+                continue
+            ready_at = self.last_start.get(host, float('-inf')) + self.min_host_interval
+            if ready_at > now:
+                soonest = ready_at if soonest is None else min(soonest, ready_at)
+                continue
+            tasks = self.pending.pop(host)
+            task = tasks.popleft()
+            if tasks:
+                self.pending[host] = tasks
+            self.active[host] = self.active.get(host, 0) + 1
+            self.last_start[host] = now
+            return host, task, None
+        return None, None, None if soonest is None else soonest - now
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    host, task, wait = self._next_task()
+                    if task is not None:
+                        break
+                    if self.closed and not self.pending:
+                        return
+                    self._cond.wait(wait)
+
+            future, fn, args = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            with self._cond:
+                self.active[host] -= 1
+                self._cond.notify_all()
+
+    def shutdown(self) -> None:
+        """Finish queued tasks, then stop the workers"""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+        for thread in self.threads:
+            thread.join()
@@ -0,0 +1,66 @@
+"""
+Local lexical relevance pre-filter that decides clear-cut links before any Gemini call
+"""
+from typing import Any, Dict, List, Optional
+
+from text_utils import token_set
+
+
+class LexicalPrefilter:
+    REJECT = 'reject'
+    ACCEPT = 'accept'
+    AMBIGUOUS = 'ambiguous'
+
+    def __init__(
+        self,
+        topic: str,
+        context_text: str,
+        topic_keywords: str,
+        reject_below: float = 0.1,
+        accept_above: float = 0.75
+    ):
+        self.reject_below = reject_below
+        self.accept_above = accept_above
+        self.topic_terms = token_set(topic) | token_set(topic_keywords)
+        self.reference_terms = self.topic_terms | token_set(context_text)
+        self.decisions: List[Dict[str, Any]] = []
+
+    def score(self, link_data: dict, original_text: str) -> float:
+        """0-1 blend of topic-term coverage and how much of the link's vocabulary the topic/context/query share"""
+        link_terms = token_set(f"{link_data.get('title', '')} {link_data.get('snippet', '')}")
+        if not link_terms:
+            return 0.0
+
+        topic_coverage = len(self.topic_terms & link_terms) / len(self.topic_terms) if self.topic_terms else 0.0
+        reference = self.reference_terms | token_set(original_text)
+        link_overlap = len(link_terms & reference) / len(link_terms)
+        return round(0.5 * topic_coverage + 0.5 * link_overlap, 4)
+
+    def decide(self, score: float) -> str:
+        if score < self.reject_below:
+            return self.REJECT
+        if score >= self.accept_above:
+            return self.ACCEPT
+        return self.AMBIGUOUS
+
+    def record(self, link_data: dict, score: float, decision: str, llm_result: Optional[dict] = None) -> None:
+        """Keep every decision (and the LLM verdict for the ambiguous band) so thresholds can be calibrated"""
+        entry = {'url': link_data.get('link', ''), 'score': score, 'decision': decision}
+        if llm_result is not None:
+            entry['llm_relevant'] = llm_result.get('relevant', False)
+            entry['llm_confidence'] = llm_result.get('confidence', 0.0)
+        self.decisions.append(entry)
+
+    def report(self) -> Dict[str, Any]:
+        counts = {self.REJECT: 0, self.ACCEPT: 0, self.AMBIGUOUS: 0}
+        for entry in self.decisions:
+            counts[entry['decision']] += 1
+        return {
+            'reject_below': self.reject_below,
+            'accept_above': self.accept_above,
+            'links_scored': len(self.decisions),
+            'auto_rejected': counts[self.REJECT],
+            'auto_accepted': counts[self.ACCEPT],
+            'llm_relevance_calls': counts[self.AMBIGUOUS],
+            'decisions': self.decisions
+        }
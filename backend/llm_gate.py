@@ -0,0 +1,78 @@
+"""
+Process-wide gate for Gemini calls: a concurrency cap shared by every debate, granted round-robin per owner
+"""
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from rate_limiter import SharedRateLimiter, shared_gemini_rate
+
+
+class FairLLMGate:
+    def __init__(self, max_concurrent: int = 4, rate_limiter: Optional[SharedRateLimiter] = None):
+        self.max_concurrent = max_concurrent
+        self.rate_limiter = rate_limiter
+        self.active = 0
+        # Owners in turn order; a served owner with more waiting calls moves to the back of the line
+        self.waiting: 'OrderedDict[str, deque]' = OrderedDict()
+        self.granted = set()
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'FairLLMGate':
+        """Cap from debate_settings; with shared_rate_limit, debates draw from the 'gemini' bucket batch workers use"""
+        settings = config.get('debate_settings', {})
+        rate_limiter = None
+        if settings.get('shared_rate_limit', False):
+            rate_limiter = SharedRateLimiter.from_config(config, 'gemini', shared_gemini_rate(config))
+        return cls(settings.get('max_concurrent_llm_calls', 4), rate_limiter)
+
+    def _dispatch(self) -> None:
+        while self.active < self.max_concurrent and self.waiting:
+            owner, tickets = self.waiting.popitem(last=False)
+            self.granted.add(tickets.popleft())
+            self.active += 1
+            if tickets:
+                self.waiting[owner] = tickets
+        self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, owner: str) -> Iterator[None]:
+        ticket = object()
+        with self._cond:
+            self.waiting.setdefault(owner, deque()).append(ticket)
+            self._dispatch()
+            while ticket not in self.granted:
+                self._cond.wait()
+            self.granted.discard(ticket)
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            yield
+        finally:
+            with self._cond:
+                self.active -= 1
+                self._dispatch()
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'active': self.active,
+                'waiting': sum(len(tickets) for tickets in self.waiting.values()),
+                'waiting_owners': len(self.waiting)
+            }
+
+
+class GatedModel:
+    """Drop-in wrapper for a GenerativeModel that routes generate_content through the gate"""
+
+    def __init__(self, model: Any, gate: FairLLMGate, owner: str):
+        self.model = model
+        self.gate = gate
+        self.owner = owner
+
+    def generate_content(self, *args, **kwargs):
+        with self.gate.slot(self.owner):
+            return self.model.generate_content(*args, **kwargs)
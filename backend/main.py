@@ -1,76 +1,168 @@
+import argparse
 import json
+import math
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
 from datetime import datetime
-from googleapiclient.discovery import build
-from typing import List, Dict, Any
-import google.generativeai as genai
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from googleapiclient.http import build_http
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from analysis_cache import analysis_cache_key
+from browser_pool import is_session_lost
+from checkpoint import RunCheckpoint
+from circuit_breaker import CircuitOpenError, breakers
+from deadline import Deadline
+from dedupe import NearDuplicateIndex, simhash
+from domain_trust import DomainTrustTable
+from lexical_filter import LexicalPrefilter
+from page_cache import normalize_url
+from pipeline_resources import PipelineResources
+from query_clusters import QueryClusters
+from usage import BudgetExhausted, UsageLedger
+from workspace import Workspace
+
+
+# Per-call ceilings; a run deadline can only shorten them
+GEMINI_TIMEOUT_SECONDS = 30.0
+SEARCH_TIMEOUT_SECONDS = 30.0
+PAGE_LOAD_TIMEOUT_SECONDS = 15.0
+
+# extract_content_from_url returns these instead of page text when nothing was extracted
+EXTRACTION_FAILURE_PREFIXES = ('Error extracting content', 'Content extraction skipped', 'Content could not be extracted', 'Selenium not available')
+
+# Custom Search returns at most 10 results per page and only serves results 1-100
+SEARCH_PAGE_SIZE = 10
+SEARCH_MAX_RESULTS = 100
+
+# Batched rephrasing is sized with a rough chars-per-token estimate instead of a tokenizer round-trip
+CHARS_PER_TOKEN = 4
+REPHRASE_OUTPUT_TOKENS = 150
+MAX_OUTPUT_TOKENS = 8192
+
+
+def parse_trust_score(value: Any) -> Optional[float]:
+    """A Gemini trust score as a float in 0-1, or None when the reply gave no usable number"""
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return None
+    return score if 0.0 <= score <= 1.0 else None
+
+
+def parse_json_reply(text: str) -> Any:
+    """JSON from a Gemini reply, with any markdown code fence around it removed"""
+    text = text.strip()
+    if text.startswith('```json'):
+        text = text[7:]
+    if text.endswith('```'):
+        text = text[:-3]
+    return json.loads(text.strip())
 
 
 class RelevanceSearchSystem:
-    def __init__(self, config_path: str = "config.json"):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+    def __init__(
+        self,
+        config_path: str = "config.json",
+        workspace: Optional[Workspace] = None,
+        rate_limiters: Optional[Dict[str, Any]] = None,
+        resources: Optional[PipelineResources] = None
+    ):
+        # The server passes its long-lived resources; a standalone run builds and closes its own
+        self.owns_resources = resources is None
+        self.resources = resources or PipelineResources.from_path(config_path)
+        self.config = self.resources.config
         
-    # Prefer environment variables in production, fallback to config.json for local/dev
-    self.api_key = os.getenv("GOOGLE_API_KEY", self.config.get('api_key', ''))
-    self.search_engine_id = os.getenv("SEARCH_ENGINE_ID", self.config.get('search_engine_id', ''))
+        self.workspace = workspace or Workspace()
+        
+        self.api_key = self.resources.api_key
+        self.search_engine_id = self.resources.search_engine_id
         self.links_per_text = self.config['links_per_text']
+        # links_per_text above 10 spans several result pages; pages after the first are fetched in
+        # concurrent waves, and only while a statement still has fewer than min_relevant_links
+        self.search_pages = math.ceil(min(self.links_per_text, SEARCH_MAX_RESULTS) / SEARCH_PAGE_SIZE)
+        self.parallel_pages = self.config['search_settings'].get('parallel_pages', 3)
+        self.min_relevant_links = self.config['search_settings'].get('min_relevant_links', 3)
         self.delay = self.config['rate_limiting']['delay_between_requests']
         self.max_retries = self.config['rate_limiting']['max_retries']
+        self.search_service = self.resources.search_service
+        self.gemini_model = self.resources.gemini_model
         
-        self.search_service = build("customsearch", "v1", developerKey=self.api_key) if self.api_key else None
-
-        # Configure Gemini if API key is available; otherwise run in degraded mode
-        self.gemini_model = None
-        try:
-            if self.api_key:
-                genai.configure(api_key=self.api_key)
-                self.gemini_model = genai.GenerativeModel(
-                    model_name=self.config['gemini_settings']['model']
-                )
-            else:
-                print("Warning: GOOGLE_API_KEY not set; Gemini features disabled.\n")
-        except Exception as e:
-            print(f"Warning: Could not initialize Gemini model: {str(e)}\n")
-        
-        input_file = os.path.join('data', 'input.json')
-        with open(input_file, 'r', encoding='utf-8') as f:
-            self.input_data = json.load(f)
+        self.input_data = self.workspace.load_input()
         
         self.topic = self.input_data.get('topic', '')
         self.context_text = self.input_data.get('text', '')
         self.relevance_threshold = self.config['gemini_settings']['relevance_threshold']
         self.requests_per_minute = self.config['gemini_settings'].get('requests_per_minute', 10)
         self.wait_on_rate_limit = self.config['gemini_settings'].get('wait_on_rate_limit', True)
+        self.evaluation_mode = self.config['gemini_settings'].get('evaluation_mode', 'two_call')
+        # Prompt plus expected output per batched rephrase call; 0 rephrases one statement per call
+        self.rephrase_batch_tokens = self.config['gemini_settings'].get('rephrase_batch_tokens', 8000)
+        self.rephrase_queue: List[Tuple[str, int, str]] = []
+        self.rephrasings: Dict[Tuple[str, int], str] = {}
+        self.rephrase_stats = {'batch_calls': 0, 'batched': 0, 'single': 0}
         self.request_count = 0
         self.minute_start = time.time()
+        # Optional shared limiters ('gemini', 'search') that coordinate quota across processes
+        self.rate_limiters = rate_limiters or {}
         
-    self.topic_keywords = self._extract_keywords_from_topic()
+        self.topic_keywords = self._extract_keywords_from_topic()
         
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--log-level=3')
-            self.driver = webdriver.Chrome(options=chrome_options)
-            print("Selenium WebDriver initialized successfully\n")
-        except Exception as e:
-            print(f"Warning: Could not initialize Selenium WebDriver: {str(e)}")
-            print("Content extraction will be skipped\n")
-            self.driver = None
+        prefilter_settings = self.config.get('prefilter_settings', {})
+        self.prefilter = None
+        if prefilter_settings.get('enabled', True):
+            self.prefilter = LexicalPrefilter(
+                self.topic,
+                self.context_text,
+                self.topic_keywords,
+                reject_below=prefilter_settings.get('reject_below', 0.1),
+                accept_above=prefilter_settings.get('accept_above', 0.75)
+            )
+        
+        # Extractions run concurrently under per-host politeness; each worker borrows a browser from the
+        # shared pool, which grows on demand up to one browser per worker
+        self.extractor = self.resources.extractor
+        self.browsers = self.resources.browsers
         
         if self.config['output_settings']['save_results']:
             os.makedirs(self.config['output_settings']['output_folder'], exist_ok=True)
+        
+        self.store = self.resources.store
+        
+        trust_settings = self.config.get('trust_settings', {})
+        self.domain_trust = None
+        if trust_settings.get('use_domain_priors', True):
+            self.domain_trust = DomainTrustTable(
+                user_priors=trust_settings.get('domain_priors', {}),
+                learned=self.store.learned_domain_trust(),
+                min_observations=trust_settings.get('min_observations', 3)
+            )
+        self.trust_stats = {'domain_prior': 0, 'llm': 0}
+        self.export_json = self.config.get('storage_settings', {}).get('export_json', True)
+        self.topic_id = None
+        self.checkpoint = RunCheckpoint()
+        self.deadline = Deadline()
+        self.partial = False
+        self.usage = UsageLedger(self.config.get('budget_settings'))
+        
+        page_cache_settings = self.config.get('page_cache_settings', {})
+        self.page_cache = self.resources.page_cache
+        self.page_fresh_seconds = page_cache_settings.get('fresh_seconds', 3600)
+        self.revalidate_timeout = page_cache_settings.get('revalidate_timeout_seconds', 5.0)
+        self.page_stats = {'fresh': 0, 'revalidated': 0, 'loaded': 0}
+        
+        dedupe_settings = self.config.get('dedupe_settings', {})
+        self.dedupe_enabled = dedupe_settings.get('enabled', True)
+        self.snippet_max_distance = dedupe_settings.get('snippet_max_distance', 3)
+        self.content_max_distance = dedupe_settings.get('content_max_distance', 3)
+        self.dedupe_stats = {'snippet_mirrors': 0, 'content_mirrors': 0}
+        
+        clustering_settings = self.config.get('clustering_settings', {})
+        self.clustering_enabled = clustering_settings.get('enabled', True)
+        self.cluster_threshold = clustering_settings.get('similarity_threshold', 0.7)
+        self.query_clusters = QueryClusters(self.cluster_threshold)
     
     def _extract_keywords_from_topic(self) -> str:
         words = self.topic.split()
@@ -113,12 +205,13 @@ Respond ONLY with the rephrased text, nothing else."""
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = self.gemini_model.generate_content(
+                response = self._generate_content(
                     prompt,
                     generation_config={
                         'temperature': 0.3,
                         'max_output_tokens': 150
-                    }
+                    },
+                    request_options={'timeout': self.deadline.timeout(GEMINI_TIMEOUT_SECONDS)}
                 )
                 
                 self.request_count += 1
@@ -141,49 +234,243 @@ Respond ONLY with the rephrased text, nothing else."""
         
         return original_text
     
+    def rephrase_batch(self, texts: List[str]) -> Dict[int, str]:
+        """One Gemini call for a numbered list of texts; returns index -> rephrased text for the entries that parsed"""
+        if not getattr(self, 'gemini_model', None):
+            return {}
+        
+        self._manage_rate_limit()
+        
+        numbered = '\n'.join(f"{number}. {text}" for number, text in enumerate(texts, 1))
+        prompt = f"""You are rephrasing search queries to be more specific and contextual.
+
+INPUT TOPIC: {self.topic}
+
+ORIGINAL SEARCH TEXTS:
+{numbered}
+
+Task: Rephrase each original search text to relate it to the input topic, while preserving its original meaning and sentiment.
+
+Rules:
+1. Keep the core meaning and perspective of each original text unchanged
+2. Connect it naturally to the input topic
+3. Make it more specific for better search results
+4. Keep each one concise (under 100 words)
+5. Do not add bias or change the political stance
+
+Respond ONLY with a JSON object mapping each number to its rephrased text, for example:
+{{"1": "rephrased text", "2": "rephrased text"}}"""
+
+        try:
+            response = self._generate_content(
+                prompt,
+                generation_config={
+                    'temperature': 0.3,
+                    'max_output_tokens': min(MAX_OUTPUT_TOKENS, REPHRASE_OUTPUT_TOKENS * len(texts))
+                },
+                request_options={'timeout': self.deadline.timeout(GEMINI_TIMEOUT_SECONDS)}
+            )
+            
+            self.rephrase_stats['batch_calls'] += 1
+            result = parse_json_reply(response.text)
+        except Exception as e:
+            print(f"    Error batch rephrasing: {str(e)[:100]}")
+            return {}
+        
+        if not isinstance(result, dict):
+            return {}
+        rephrased = {}
+        for key, value in result.items():
+            if str(key).strip().isdigit() and 1 <= int(key) <= len(texts) and isinstance(value, str) and value.strip():
+                rephrased[int(key) - 1] = value.strip()
+        return rephrased
+    
+    def _rephrase_next_batch(self, key: Tuple[str, int]) -> None:
+        """Rephrase key together with the statements queued right after it, as many as fit the token budget"""
+        overhead = 250 + len(self.topic) // CHARS_PER_TOKEN
+        batch, tokens = [], overhead
+        first = next(unit for unit in self.rephrase_queue if unit[:2] == key)
+        for unit in [first] + [unit for unit in self.rephrase_queue if unit is not first]:
+            cost = len(unit[2]) // CHARS_PER_TOKEN + REPHRASE_OUTPUT_TOKENS
+            if batch and (tokens + cost > self.rephrase_batch_tokens or
+                          REPHRASE_OUTPUT_TOKENS * (len(batch) + 1) > MAX_OUTPUT_TOKENS):
+                break
+            batch.append(unit)
+            tokens += cost
+        
+        # Batched statements leave the queue whatever the outcome; entries that did not parse fall back to single calls
+        batched_keys = {unit[:2] for unit in batch}
+        self.rephrase_queue = [unit for unit in self.rephrase_queue if unit[:2] not in batched_keys]
+        if len(batch) < 2:
+            return
+        
+        rephrased = self.rephrase_batch([unit[2] for unit in batch])
+        for position, text in rephrased.items():
+            self.rephrasings[batch[position][:2]] = text
+        self.rephrase_stats['batched'] += len(rephrased)
+        print(f"  Rephrased {len(rephrased)} of {len(batch)} statements in one batch")
+    
+    def _rephrase(self, source_file: str, idx: int, text: str) -> str:
+        key = (source_file, idx)
+        if self.rephrase_batch_tokens and self.gemini_model and key not in self.rephrasings and \
+                not self.deadline.expired and any(unit[:2] == key for unit in self.rephrase_queue):
+            self._rephrase_next_batch(key)
+        if key in self.rephrasings:
+            return self.rephrasings.pop(key)
+        self.rephrase_stats['single'] += 1
+        return self.rephrase_with_topic_context(text)
+    
+    def _page_validators(self, response: httpx.Response) -> Dict[str, Optional[str]]:
+        return {'etag': response.headers.get('etag'), 'last_modified': response.headers.get('last-modified')}
+    
+    def _revalidate_page(self, url: str, cached: Dict[str, Any]) -> Tuple[Optional[int], Dict[str, Optional[str]]]:
+        """Conditional GET against the cached validators; returns the status code (None if not possible) and fresh validators"""
+        headers = {}
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+        if not headers:
+            return None, {}
+        
+        try:
+            response = self.resources.http_client.get(url, headers=headers, timeout=self.deadline.timeout(self.revalidate_timeout))
+        except httpx.HTTPError:
+            return None, {}
+        return response.status_code, self._page_validators(response)
+    
+    def _fetch_page_validators(self, url: str) -> Dict[str, Optional[str]]:
+        try:
+            response = self.resources.http_client.head(url, timeout=self.deadline.timeout(self.revalidate_timeout))
+        except httpx.HTTPError:
+            return {}
+        return self._page_validators(response)
+    
+    def _fresh_page(self, url: str) -> Optional[str]:
+        """Cached text still inside its freshness window, served without any request"""
+        cached = self.page_cache.get(url) if self.page_cache else None
+        if cached and time.time() - cached['fetched_at'] < self.page_fresh_seconds:
+            self.page_stats['fresh'] += 1
+            return cached['content']
+        return None
+    
     def extract_content_from_url(self, url: str) -> str:
-        if not self.driver:
+        # Cached text is served outright while fresh, and after a 304 once it is stale
+        fresh = self._fresh_page(url)
+        if fresh is not None:
+            return fresh
+        validators = {}
+        if self.page_cache:
+            cached = self.page_cache.get(url)
+            if cached:
+                status, validators = self._revalidate_page(url, cached)
+                if status == 304:
+                    self.page_cache.touch(url)
+                    self.page_stats['revalidated'] += 1
+                    return cached['content']
+        
+        if not self.browsers.available:
             return "Selenium not available - content extraction skipped"
         
         try:
-            self.driver.set_page_load_timeout(15)
-            self.driver.get(url)
+            self.usage.reserve('page_loads')
+        except BudgetExhausted as e:
+            return f"Content extraction skipped: {e}"
+        
+        driver = self.browsers.acquire()
+        if driver is None:
+            self.usage.release('page_loads')
+            return "Selenium not available - content extraction skipped"
+        
+        # Past allow() every path records an outcome, or a half-open probe would never be released
+        breaker = breakers.get('extraction')
+        if not breaker.allow():
+            self.usage.release('page_loads')
+            self.browsers.release(driver)
+            return f"Error extracting content: {CircuitOpenError('extraction')}"
+        healthy = True
+        try:
+            self.page_stats['loaded'] += 1
+            page_load_timeout = self.deadline.timeout(PAGE_LOAD_TIMEOUT_SECONDS, minimum=1.0)
+            try:
+                driver.set_page_load_timeout(page_load_timeout)
+                driver.get(url)
+            except Exception:
+                self._record_failure(breaker, page_load_timeout < PAGE_LOAD_TIMEOUT_SECONDS)
+                raise
+            breaker.record_success()
             
-            time.sleep(2)
+            self.deadline.sleep(2)
             
             try:
-                body = self.driver.find_element(By.TAG_NAME, 'body')
+                body = driver.find_element(By.TAG_NAME, 'body')
                 content = body.text
             except:
-                content = self.driver.page_source
+                content = driver.page_source
             
             content = ' '.join(content.split())
             
             if len(content) > 5000:
                 content = content[:5000]
             
+            if content and self.page_cache:
+                self.page_cache.put(url, content, **(validators or self._fetch_page_validators(url)))
+            
             return content if content else "Content could not be extracted"
         
         except Exception as e:
+            # A crashed or disconnected browser is replaced instead of being handed to the next page
+            healthy = not is_session_lost(e)
             return f"Error extracting content: {str(e)[:100]}"
+        finally:
+            self.browsers.release(driver, healthy)
     
-    def search_google(self, query: str, rephrased_query: str) -> List[Dict[str, str]]:
+    def _extract_within_deadline(self, url: str) -> Tuple[str, bool]:
+        """Page text, and whether it was extracted before the run deadline passed"""
+        content = self.extract_content_from_url(url)
+        return content, not self.deadline.expired
+    
+    def search_google(self, query: str, rephrased_query: str, start: int = 1, http: Any = None) -> List[Dict[str, str]]:
+        """One page of results beginning at the 1-based start offset; http gives a thread its own connection"""
         search_query = f"{rephrased_query} {self.topic_keywords}"
 
         if not self.search_service:
             # No Search API configured
             return []
         
+        breaker = breakers.get('search')
         for attempt in range(self.max_retries):
+            # The budget is checked first, so a half-open probe is only taken by a call that goes out
+            try:
+                self.usage.reserve('search_queries')
+            except BudgetExhausted:
+                return []
+            # While the breaker is open the search is skipped without waiting out the retry delays
+            if not breaker.allow():
+                self.usage.release('search_queries')
+                return []
+            # Quota that would only free up after the deadline is not waited for
+            if 'search' in self.rate_limiters and self.rate_limiters['search'].acquire(timeout=self.deadline.remaining()) is None:
+                breaker.release()
+                self.usage.release('search_queries')
+                return []
+            call_http = http or self.resources.search_http()
+            search_timeout = self.deadline.timeout(SEARCH_TIMEOUT_SECONDS)
+            if self.deadline.remaining() is not None:
+                # A fresh connection, so its socket timeout is capped by what is left of the deadline
+                call_http = build_http()
+                call_http.timeout = search_timeout
             try:
                 result = self.search_service.cse().list(
                     q=search_query,
                     cx=self.search_engine_id,
-                    num=min(self.links_per_text, 10),
+                    num=min(min(self.links_per_text, SEARCH_MAX_RESULTS) - (start - 1), SEARCH_PAGE_SIZE),
+                    start=start,
                     safe=self.config['search_settings']['safe'],
                     lr=f"lang_{self.config['search_settings']['language']}",
                     cr=f"country{self.config['search_settings']['country'].upper()}"
-                ).execute()
+                ).execute(http=call_http)
+                breaker.record_success()
                 
                 links = []
                 if 'items' in result:
@@ -197,14 +484,39 @@ Respond ONLY with the rephrased text, nothing else."""
                 return links
             
             except Exception as e:
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.delay * (attempt + 1))
+                self._record_failure(breaker, search_timeout < SEARCH_TIMEOUT_SECONDS)
+                if attempt < self.max_retries - 1 and not self.deadline.expired:
+                    self.deadline.sleep(self.delay * (attempt + 1))
                     continue
                 else:
                     print(f"Error searching for '{query[:50]}...': {str(e)}")
                     return []
     
+    def search_next_pages(self, query: str, rephrased_query: str, pages_fetched: int) -> Tuple[List[Dict[str, str]], int]:
+        """
+        The next wave of up to parallel_pages result pages, fetched concurrently; returns their links in
+        rank order and the number of pages fetched so far. Each page still passes the shared search limiter.
+        """
+        last_page = min(pages_fetched + self.parallel_pages, self.search_pages)
+        starts = [1 + SEARCH_PAGE_SIZE * page for page in range(pages_fetched, last_page)]
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(starts))) as pool:
+            futures = []
+            for position, start in enumerate(starts):
+                # Without a shared limiter, page requests keep the usual spacing between their starts
+                if position and 'search' not in self.rate_limiters:
+                    self.deadline.sleep(self.delay)
+                # The discovery client's HTTP object is not thread-safe, so each page gets its own
+                futures.append(pool.submit(self.search_google, query, rephrased_query, start, build_http()))
+            pages = [future.result() for future in futures]
+        
+        return [link for page in pages for link in page], last_page
+    
     def _manage_rate_limit(self):
+        if 'gemini' in self.rate_limiters:
+            self.rate_limiters['gemini'].acquire()
+            return
+        
         # RATE LIMITING DISABLED - Uncomment code below to enable
         pass
         # current_time = time.time()
@@ -222,7 +534,44 @@ Respond ONLY with the rephrased text, nothing else."""
         #         self.request_count = 0
         #         self.minute_start = time.time()
     
+    def _record_failure(self, breaker: Any, cut_short: bool) -> None:
+        """
+        Breakers are shared by every run in the worker, so a call whose timeout this run's deadline cut
+        short says nothing about the dependency; its half-open probe is handed back instead
+        """
+        if cut_short or self.deadline.expired:
+            breaker.release()
+        else:
+            breaker.record_failure()
+    
+    def _generate_content(self, prompt: str, **kwargs):
+        """
+        Gemini call guarded by the run budget and the shared breaker; raises BudgetExhausted or
+        CircuitOpenError instead of calling, so each caller falls back to its usual default result
+        """
+        self.usage.reserve('llm')
+        breaker = breakers.get('gemini')
+        if not breaker.allow():
+            self.usage.release('llm')
+            raise CircuitOpenError('gemini')
+        timeout = kwargs.get('request_options', {}).get('timeout', GEMINI_TIMEOUT_SECONDS)
+        try:
+            response = self.gemini_model.generate_content(prompt, **kwargs)
+        except Exception:
+            self._record_failure(breaker, timeout < GEMINI_TIMEOUT_SECONDS)
+            raise
+        breaker.record_success()
+        self.usage.record_llm(response)
+        return response
+    
     def check_trust_score(self, link_data: dict) -> dict:
+        # Known domains get an instant deterministic score; Gemini is reserved for unknown ones
+        if self.domain_trust:
+            prior = self.domain_trust.lookup(link_data.get('link', ''))
+            if prior:
+                self.trust_stats['domain_prior'] += 1
+                return prior
+        
         # If Gemini isn't configured, return a neutral default
         if not getattr(self, 'gemini_model', None):
             return {
@@ -274,30 +623,30 @@ Respond ONLY with a JSON object:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = self.gemini_model.generate_content(
+                response = self._generate_content(
                     prompt,
                     generation_config={
                         'temperature': self.config['gemini_settings']['temperature'],
                         'max_output_tokens': 250
-                    }
+                    },
+                    request_options={'timeout': self.deadline.timeout(GEMINI_TIMEOUT_SECONDS)}
                 )
                 
                 self.request_count += 1
                 
-                response_text = response.text.strip()
-                
-                if response_text.startswith('```json'):
-                    response_text = response_text[7:]
-                if response_text.endswith('```'):
-                    response_text = response_text[:-3]
-                
-                result = json.loads(response_text.strip())
+                result = parse_json_reply(response.text)
                 
-                return {
-                    'trust_score': result.get('trust_score', 0.5),
+                trust_score = parse_trust_score(result.get('trust_score', 0.5))
+                trust_result = {
+                    'trust_score': 0.5 if trust_score is None else trust_score,
                     'source_type': result.get('source_type', 'Unknown'),
                     'trust_reasoning': result.get('trust_reasoning', '')
                 }
+                self.trust_stats['llm'] += 1
+                # Only a validated score becomes evidence for the domain prior
+                if trust_score is not None:
+                    self._learn_domain_trust(url, trust_result)
+                return trust_result
             
             except Exception as e:
                 error_str = str(e)
@@ -323,6 +672,14 @@ Respond ONLY with a JSON object:
             'trust_reasoning': 'Max retries exceeded'
         }
     
+    def _learn_domain_trust(self, url: str, trust_result: dict) -> None:
+        """Feed a Gemini trust score back into the domain table so repeat domains become known"""
+        if not self.domain_trust:
+            return
+        domain = self.domain_trust.observe(url, trust_result)
+        if domain:
+            self.store.observe_domain_trust(domain, float(trust_result['trust_score']), trust_result['source_type'])
+    
     def check_relevance(self, link_data: dict, original_text: str) -> dict:
         # If Gemini isn't configured, return a conservative not-relevant result
         if not getattr(self, 'gemini_model', None):
@@ -371,24 +728,18 @@ Respond ONLY with a JSON object in this exact format:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = self.gemini_model.generate_content(
+                response = self._generate_content(
                     prompt,
                     generation_config={
                         'temperature': self.config['gemini_settings']['temperature'],
                         'max_output_tokens': 200
-                    }
+                    },
+                    request_options={'timeout': self.deadline.timeout(GEMINI_TIMEOUT_SECONDS)}
                 )
                 
                 self.request_count += 1
                 
-                response_text = response.text.strip()
-                
-                if response_text.startswith('```json'):
-                    response_text = response_text[7:]
-                if response_text.endswith('```'):
-                    response_text = response_text[:-3]
-                
-                result = json.loads(response_text.strip())
+                result = parse_json_reply(response.text)
                 
                 return {
                     'relevant': result.get('relevant', False),
@@ -423,46 +774,222 @@ Respond ONLY with a JSON object in this exact format:
             'link_data': link_data
         }
     
-    def process_json_file(self, file_path: str) -> Dict[str, Any]:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def check_relevance_and_trust(self, link_data: dict, original_text: str) -> dict:
+        """One Gemini call that returns both the relevance verdict and the trust assessment"""
+        if not getattr(self, 'gemini_model', None):
+            return self.check_relevance(link_data, original_text)
+
+        self._manage_rate_limit()
         
-        results = []
+        url = link_data.get('link', '')
+        domain = url.split('/')[2] if len(url.split('/')) > 2 else url
         
-        for idx, item in enumerate(data):
-            text = item.get('text', '')
-            if not text:
-                continue
-            
-            print(f"Processing item {idx + 1}/{len(data)} from {os.path.basename(file_path)}")
-            print(f"  Original: {text[:80]}...")
+        prompt = f"""You are analyzing a web search result for relevance to a specific topic and for the trustworthiness of its source.
+
+TOPIC: {self.topic}
+
+CONTEXT: {self.context_text}
+
+SEARCH QUERY: {original_text}
+
+LINK TO EVALUATE:
+Title: {link_data.get('title', '')}
+URL: {url}
+Domain: {domain}
+Snippet: {link_data.get('snippet', '')}
+
+Task 1 - Relevance: Determine if this link contains content relevant to the given topic and context.
+Relevant: direct mentions of the topic, discussion of events, people or issues in the context,
+related news, analysis or commentary. NOT relevant: articles about different subjects, people or unrelated news.
+
+Task 2 - Trust: Rate the source's trustworthiness by source type, reputation, bias, verification and editorial standards.
+0.9-1.0: Highly trusted (major news, academic journals, government sites)
+0.7-0.89: Trusted (established media, reputable organizations)
+0.5-0.69: Moderately trusted (known sources with some bias/mixed quality)
+0.3-0.49: Low trust (social media posts, blogs, user-generated content)
+0.0-0.29: Very low trust (unreliable sources, known misinformation)
+
+Respond ONLY with a JSON object in this exact format:
+{{
+    "relevant": true or false,
+    "confidence": 0.0 to 1.0,
+    "reason": "brief explanation",
+    "trust_score": 0.0 to 1.0,
+    "source_type": "News Media/Academic/Government/Social Media/Blog/etc",
+    "trust_reasoning": "brief explanation"
+}}"""
+
+        try:
+            response = self._generate_content(
+                prompt,
+                generation_config={
+                    'temperature': self.config['gemini_settings']['temperature'],
+                    'max_output_tokens': 300
+                },
+                request_options={'timeout': self.deadline.timeout(GEMINI_TIMEOUT_SECONDS)}
+            )
             
-            rephrased_text = self.rephrase_with_topic_context(text)
+            result = parse_json_reply(response.text)
+            trust_score = parse_trust_score(result.get('trust_score'))
+        except Exception as e:
+            print(f"    Combined check error: {url[:50]}... - {str(e)[:100]}")
+            return {
+                'relevant': False,
+                'confidence': 0.0,
+                'reason': f'Error: {str(e)[:100]}',
+                'link_data': link_data
+            }
+        
+        relevance = {
+            'relevant': result.get('relevant', False),
+            'confidence': result.get('confidence', 0.0),
+            'reason': result.get('reason', ''),
+            'link_data': link_data
+        }
+        # Without a usable score the trust half is dropped, so a relevant link gets its own trust check
+        if trust_score is None:
+            return relevance
+        
+        trust_result = {
+            'trust_score': trust_score,
+            'source_type': result.get('source_type', 'Unknown'),
+            'trust_reasoning': result.get('trust_reasoning', '')
+        }
+        self.trust_stats['llm'] += 1
+        self._learn_domain_trust(url, trust_result)
+        relevance['trust'] = trust_result
+        return relevance
+    
+    def _llm_relevance(self, link_data: dict, original_text: str) -> dict:
+        # The combined call only pays off when the trust score would otherwise need its own Gemini call
+        if self.evaluation_mode == 'combined' and not (
+            self.domain_trust and self.domain_trust.lookup(link_data.get('link', ''))
+        ):
+            return self.check_relevance_and_trust(link_data, original_text)
+        return self.check_relevance(link_data, original_text)
+    
+    def evaluate_relevance(self, link_data: dict, original_text: str) -> dict:
+        """Lexical pre-filter first; only the ambiguous middle band is sent to Gemini"""
+        if not self.prefilter:
+            return self._llm_relevance(link_data, original_text)
+        
+        score = self.prefilter.score(link_data, original_text)
+        decision = self.prefilter.decide(score)
+        
+        if decision == LexicalPrefilter.AMBIGUOUS:
+            result = self._llm_relevance(link_data, original_text)
+            self.prefilter.record(link_data, score, decision, result)
+            return result
+        
+        self.prefilter.record(link_data, score, decision)
+        return {
+            'relevant': decision == LexicalPrefilter.ACCEPT,
+            'confidence': score,
+            'reason': f'Lexical pre-filter {decision}ed (score {score})',
+            'link_data': link_data
+        }
+    
+    def process_item(self, source_file: str, idx: int, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Search, filter and score the links for one statement; None for statements without text"""
+        text = item.get('text', '')
+        if not text:
+            return None
+        
+        # Out of budget: the statement stays in the output, explicitly marked as not searched
+        if self.deadline.expired:
+            return {
+                'original_data': item,
+                'search_query': text,
+                'relevant_links': [],
+                'relevant_count': 0,
+                'total_checked': 0,
+                'partial': True
+            }
+        
+        print(f"Processing item {idx + 1} from {source_file} (combined score {self._combined_score(item):.4f})")
+        print(f"  Original: {text[:80]}...")
+        
+        search_unit = self.checkpoint.get('search', source_file, idx)
+        pages_fetched = 1
+        item_partial = False
+        if search_unit:
+            rephrased_text = search_unit['rephrased']
+            search_results = search_unit['search_results']
+            pages_fetched = search_unit.get('pages', 1)
+            print(f"  Resumed search from checkpoint")
+            if self.clustering_enabled and search_results and self.query_clusters.find(rephrased_text) is None:
+                self.query_clusters.add(rephrased_text, search_results)
+        else:
+            rephrased_text = self._rephrase(source_file, idx, text)
             print(f"  Rephrased: {rephrased_text[:80]}...")
-            time.sleep(self.delay)
             
-            search_results = self.search_google(text, rephrased_text)
-            time.sleep(self.delay)
+            # Statements whose rephrased queries nearly coincide share one Custom Search call;
+            # relevance is still judged per statement below
+            cluster = self.query_clusters.find(rephrased_text) if self.clustering_enabled else None
+            if cluster is not None:
+                search_results = self.query_clusters.join(cluster)
+                print(f"  Shared search results of query cluster {cluster}")
+            else:
+                self.deadline.sleep(self.delay)
+                search_results = self.search_google(text, rephrased_text)
+                # Empty results (quota, outage) are not shared, so the next similar statement retries
+                if self.clustering_enabled and search_results:
+                    self.query_clusters.add(rephrased_text, search_results)
+                self.deadline.sleep(self.delay)
+            # A search that ended past the deadline may have been cut short (limiter wait, socket timeout),
+            # so the statement counts as partial even when no link is left to check
+            if self.deadline.expired:
+                item_partial = True
+            else:
+                self.checkpoint.record(
+                    'search', source_file, idx,
+                    data={'rephrased': rephrased_text, 'search_results': search_results}
+                )
+        
+        print(f"  Found {len(search_results)} links, checking relevance...")
+        
+        relevant_links = []
+        # Canonical URL -> URLs of near-identical copies that were never evaluated on their own
+        mirrors: Dict[str, List[str]] = {}
+        extractions = []
+        snippet_index = NearDuplicateIndex(self.snippet_max_distance) if self.dedupe_enabled else None
+        
+        checked = 0
+        while True:
+            for position in range(checked, len(search_results)):
+                link = search_results[position]
+                # Syndicated copies collapse onto the first (highest-ranked) result before paying for relevance
+                if snippet_index is not None:
+                    fingerprint = simhash(f"{link.get('title', '')} {link.get('snippet', '')}")
+                    canonical = snippet_index.match(fingerprint)
+                    if canonical is not None:
+                        mirrors.setdefault(canonical, []).append(link['link'])
+                        self.dedupe_stats['snippet_mirrors'] += 1
+                        continue
+                    snippet_index.add(fingerprint, link['link'])
             
-            print(f"  Found {len(search_results)} links, checking relevance...")
+                link_unit = self.checkpoint.get('link', source_file, idx, position)
+                if link_unit:
+                    if link_unit['relevant_link']:
+                        relevant_links.append(link_unit['relevant_link'])
+                    continue
             
-            relevant_links = []
+                if self.deadline.expired:
+                    item_partial = True
+                    break
+            
+                relevant_link = None
+                relevance_check = self.evaluate_relevance(link, text)
             
-            for link in search_results:
-                relevance_check = self.check_relevance(link, text)
-                
                 if relevance_check['relevant'] and relevance_check['confidence'] >= self.relevance_threshold:
                     print(f"    Relevant: {link['title'][:60]}... (confidence: {relevance_check['confidence']})")
-                    print(f"      Checking trust score...")
-                    
-                    trust_check = self.check_trust_score(link)
+                    trust_check = relevance_check.get('trust')
+                    if trust_check is None:
+                        print(f"      Checking trust score...")
+                        trust_check = self.check_trust_score(link)
                     print(f"      Trust score: {trust_check['trust_score']} ({trust_check['source_type']})")
-                    
-                    print(f"      Extracting content from URL...")
-                    extracted_content = self.extract_content_from_url(link['link'])
-                    print(f"      Extracted {len(extracted_content)} characters")
-                    
-                    relevant_links.append({
+                
+                    relevant_link = {
                         'title': link['title'],
                         'link': link['link'],
                         'snippet': link['snippet'],
@@ -470,33 +997,179 @@ Respond ONLY with a JSON object in this exact format:
                         'relevance_reason': relevance_check['reason'],
                         'trust_score': trust_check['trust_score'],
                         'source_type': trust_check['source_type'],
-                        'trust_reasoning': trust_check['trust_reasoning'],
-                        'extracted_content': extracted_content
-                    })
+                        'trust_reasoning': trust_check['trust_reasoning']
+                    }
+                    # Extraction overlaps the remaining relevance checks; the unit is recorded once it lands.
+                    # Fresh cached pages send no request, so they skip the per-host queue
+                    fresh = self._fresh_page(link['link'])
+                    if fresh is not None:
+                        extraction = Future()
+                        extraction.set_result((fresh, True))
+                    else:
+                        extraction = self.extractor.submit(link['link'], self._extract_within_deadline, link['link'])
+                    extractions.append((position, relevant_link, extraction))
                 else:
                     print(f"    Not relevant: {link['title'][:60]}... (confidence: {relevance_check['confidence']})")
-                
-                time.sleep(self.delay)
             
-            results.append({
-                'original_data': item,
-                'search_query': text,
-                'relevant_links': relevant_links,
-                'relevant_count': len(relevant_links),
-                'total_checked': len(search_results)
-            })
+                # A unit that overran the budget ran on truncated timeouts, so it is dropped rather than trusted
+                if self.deadline.expired:
+                    item_partial = True
+                    break
+            
+                if relevant_link:
+                    relevant_links.append(relevant_link)
+                else:
+                    self.checkpoint.record('link', source_file, idx, position, data={'relevant_link': None})
+                self.deadline.sleep(self.delay)
+            
+            # Deeper result pages only while the statement is still short of relevant links
+            checked = len(search_results)
+            if item_partial or len(relevant_links) >= self.min_relevant_links or pages_fetched >= self.search_pages:
+                break
+            more_results, pages_fetched = self.search_next_pages(text, rephrased_text, pages_fetched)
+            seen = {normalize_url(link['link']) for link in search_results}
+            new_results = []
+            for link in more_results:
+                if normalize_url(link['link']) not in seen:
+                    seen.add(normalize_url(link['link']))
+                    new_results.append(link)
+            # A new list, since the first page may be shared with the statement's query cluster
+            search_results = search_results + new_results
+            print(f"  Fetched result pages up to {pages_fetched}: {len(new_results)} new links")
+            if not self.deadline.expired:
+                self.checkpoint.record(
+                    'search', source_file, idx,
+                    data={'rephrased': rephrased_text, 'search_results': search_results, 'pages': pages_fetched}
+                )
+        
+        # Wait no longer than the deadline; pages still queued then are never loaded
+        futures_wait([extraction for _, _, extraction in extractions], timeout=self.deadline.remaining())
+        for _, _, extraction in extractions:
+            extraction.cancel()
+        for position, relevant_link, extraction in extractions:
+            finished_in_time = not extraction.cancelled()
+            if finished_in_time:
+                relevant_link['extracted_content'], finished_in_time = extraction.result()
+            # An extraction that finished past the deadline ran on truncated timeouts, so it is dropped;
+            # those that landed before it are kept whenever they are collected
+            if not finished_in_time:
+                item_partial = True
+                relevant_links = [link for link in relevant_links if link is not relevant_link]
+                continue
+            print(f"    Extracted {len(relevant_link['extracted_content'])} characters from {relevant_link['link'][:60]}")
+            self.checkpoint.record('link', source_file, idx, position, data={'relevant_link': relevant_link})
+        
+        if self.dedupe_enabled:
+            relevant_links = self._collapse_mirrors(relevant_links, mirrors)
+        
+        return {
+            'original_data': item,
+            'search_query': text,
+            'relevant_links': relevant_links,
+            'relevant_count': len(relevant_links),
+            'total_checked': len(search_results),
+            'partial': item_partial
+        }
+    
+    def _collapse_mirrors(self, links: List[Dict[str, Any]], mirrors: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """
+        Fold relevant links whose extracted text is a near-copy of another into one cluster, kept at the
+        position of its first member and represented by its most trusted member, which carries the mirrors.
+        """
+        content_index = NearDuplicateIndex(self.content_max_distance)
+        clusters = []
+        for link in links:
+            content = link.get('extracted_content', '')
+            # Extraction failures share boilerplate messages, not article text
+            fingerprint = None if content.startswith(EXTRACTION_FAILURE_PREFIXES) else simhash(content)
+            cluster = content_index.match(fingerprint)
+            if cluster is None:
+                content_index.add(fingerprint, len(clusters))
+                clusters.append([link])
+            else:
+                clusters[cluster].append(link)
+                self.dedupe_stats['content_mirrors'] += 1
         
+        collapsed = []
+        for members in clusters:
+            canonical = max(members, key=lambda member: member['trust_score'])
+            mirror_links = [
+                url
+                for member in members
+                for url in ([] if member is canonical else [member['link']]) + mirrors.get(member['link'], [])
+            ]
+            if mirror_links:
+                canonical = {**canonical, 'mirror_count': len(mirror_links), 'mirror_links': mirror_links}
+            collapsed.append(canonical)
+        return collapsed
+    
+    @staticmethod
+    def _combined_score(item: Dict[str, Any]) -> float:
+        return item.get('bias_x', 0.5) * item.get('significance_y', 0.5)
+    
+    @staticmethod
+    def _file_results(source_file: str, data: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {
-            'source_file': os.path.basename(file_path),
+            'source_file': source_file,
             'processed_at': datetime.now().isoformat(),
             'total_items': len(data),
-            'results': results
+            'results': results,
+            'partial': any(result['partial'] for result in results)
         }
     
-    def process_all_files(self, data_folder: str = "data"):
+    def _output_item(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape of one statement in relevant_*.json and in the live stream"""
+        bias_x = result['original_data'].get('bias_x', 0.5)
+        significance_y = result['original_data'].get('significance_y', 0.5)
+        
+        item = {
+            'text': result['original_data'].get('text', ''),
+            'bias_x': bias_x,
+            'significance_y': significance_y,
+            'combined_score': round(bias_x * significance_y, 4),
+            'color': result['original_data'].get('color', ''),
+            'relevant_links': []
+        }
+        if result['partial']:
+            item['partial'] = True
+        
+        for link in result['relevant_links']:
+            item['relevant_links'].append({
+                'title': link['title'],
+                'link': link['link'],
+                'snippet': link['snippet'],
+                'relevance_confidence': link['relevance_confidence'],
+                'trust_score': link['trust_score'],
+                'source_type': link['source_type'],
+                'extracted_content': link['extracted_content']
+            })
+            if link.get('mirror_count'):
+                item['relevant_links'][-1].update(mirror_count=link['mirror_count'], mirror_links=link['mirror_links'])
+        return item
+    
+    def process_all_files(
+        self,
+        data_folder: Optional[str] = None,
+        resume: bool = False,
+        deadline: Optional[Deadline] = None
+    ):
+        """
+        With resume, units already in the workspace checkpoint log are reused instead of re-run.
+        With a deadline, work left when it expires is skipped and the outputs are marked partial.
+        """
+        data_folder = data_folder or self.workspace.data_folder
+        self.deadline = deadline or Deadline()
+        self.usage = UsageLedger(self.config.get('budget_settings'))
+        self.query_clusters = QueryClusters(self.cluster_threshold)
         json_files = ['common.json', 'leftist.json', 'rightist.json']
         all_results = {}
         
+        self.checkpoint = RunCheckpoint(
+            self.workspace.checkpoint_path,
+            fingerprint=analysis_cache_key(self.config, self.topic, self.context_text, data_folder),
+            resume=resume
+        )
+        
         print("="*60)
         print("GOOGLE SEARCH + GEMINI RELEVANCE FILTER")
         print("="*60)
@@ -505,50 +1178,65 @@ Respond ONLY with a JSON object in this exact format:
         print(f"Relevance threshold: {self.relevance_threshold}")
         print("="*60 + "\n")
         
+        file_data = {}
         for json_file in json_files:
             file_path = os.path.join(data_folder, json_file)
             if not os.path.exists(file_path):
                 print(f"Warning: {file_path} not found, skipping...\n")
                 continue
-            
-            print(f"\nProcessing {json_file}...")
-            results = self.process_json_file(file_path)
-            all_results[json_file] = results
+            with open(file_path, 'r', encoding='utf-8') as f:
+                file_data[json_file] = json.load(f)
+        
+        # Highest combined_score statements across all perspectives go first, so a run that is cut
+        # short or read while still running already holds the evidence the debate relies on most
+        schedule = sorted(
+            ((json_file, idx, item) for json_file, data in file_data.items() for idx, item in enumerate(data)),
+            key=lambda unit: self._combined_score(unit[2]),
+            reverse=True
+        )
         
+        # Statements still to be rephrased, in schedule order, so each batch covers the next ones to run
+        self.rephrasings = {}
+        self.rephrase_queue = [
+            (json_file, idx, item['text'])
+            for json_file, idx, item in schedule
+            if item.get('text') and ('search', json_file, idx) not in self.checkpoint.units
+        ]
+        
+        results_by_file = {json_file: {} for json_file in file_data}
+        stream_path = self.workspace.stream_path
+        open(stream_path, 'w', encoding='utf-8').close()
+        
+        for json_file, idx, item in schedule:
+            result = self.process_item(json_file, idx, item)
+            if result is None:
+                continue
+            results_by_file[json_file][idx] = result
+            with open(stream_path, 'a', encoding='utf-8') as stream:
+                stream.write(json.dumps({
+                    'perspective': json_file.replace('.json', ''),
+                    'position': idx,
+                    'item': self._output_item(result)
+                }, ensure_ascii=False) + '\n')
+        
+        for json_file, data in file_data.items():
+            results = [results_by_file[json_file][idx] for idx in sorted(results_by_file[json_file])]
+            all_results[json_file] = self._file_results(json_file, data, results)
+        
+        self.partial = any(file_data['partial'] for file_data in all_results.values())
         processed_at = datetime.now().isoformat()
         total_relevant = 0
+        outputs = {}
         
         for json_file, file_data in all_results.items():
             base_name = json_file.replace('.json', '')
-            output_file = f'relevant_{base_name}.json'
+            output_file = self.workspace.relevant_path(base_name)
             
             all_items = []
             
             for result in file_data['results']:
-                bias_x = result['original_data'].get('bias_x', 0.5)
-                significance_y = result['original_data'].get('significance_y', 0.5)
-                combined_score = bias_x * significance_y
-                
-                item = {
-                    'text': result['original_data'].get('text', ''),
-                    'bias_x': bias_x,
-                    'significance_y': significance_y,
-                    'combined_score': round(combined_score, 4),
-                    'color': result['original_data'].get('color', ''),
-                    'relevant_links': []
-                }
-                
-                for link in result['relevant_links']:
-                    item['relevant_links'].append({
-                        'title': link['title'],
-                        'link': link['link'],
-                        'snippet': link['snippet'],
-                        'trust_score': link['trust_score'],
-                        'source_type': link['source_type'],
-                        'extracted_content': link['extracted_content']
-                    })
-                    total_relevant += 1
-                
+                item = self._output_item(result)
+                total_relevant += len(item['relevant_links'])
                 all_items.append(item)
             
             all_items.sort(key=lambda x: x['combined_score'], reverse=True)
@@ -558,15 +1246,27 @@ Respond ONLY with a JSON object in this exact format:
                 'source_file': json_file,
                 'processed_at': processed_at,
                 'total_items': len(all_items),
+                'partial': file_data['partial'],
+                'usage': self.usage.report(),
                 'items': all_items
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=4, ensure_ascii=False)
-            print(f"Saved: {output_file}")
+            outputs[base_name] = output_data
+            
+            if self.export_json:
+                self.workspace.write_json(output_file, output_data)
+                print(f"Saved: {output_file}")
+        
+        self.topic_id = self.store.write_analysis(
+            self.topic, outputs, job_id=self.workspace.job_id, processed_at=processed_at
+        )
+        print(f"Stored run as topic {self.topic_id} in {self.store.db_path}")
         
         self._print_summary(all_results, total_relevant)
         
+        if self.prefilter:
+            self.workspace.write_json(self.workspace.output_path('relevance_report.json'), self.prefilter.report())
+        
         return all_results
     
     def _print_summary(self, all_results: dict, total_relevant: int) -> None:
@@ -582,23 +1282,59 @@ Respond ONLY with a JSON object in this exact format:
             print(f"\n{json_file}:")
             print(f"  Total items: {total_items}")
             print(f"  Items with relevant links: {relevant_count}")
-            print(f"  Output: relevant_{base_name}.json")
+            print(f"  Output: {self.workspace.relevant_path(base_name)}")
         
         print(f"\nTOTAL RELEVANT LINKS: {total_relevant}")
+        
+        totals = self.usage.totals
+        print(f"Usage: {totals['llm_calls']} Gemini calls ({totals['prompt_tokens']} prompt / "
+              f"{totals['output_tokens']} output tokens), {totals['search_queries']} search queries, "
+              f"{totals['page_loads']} page loads")
+        print(f"Pages: {self.page_stats['fresh']} fresh from cache, {self.page_stats['revalidated']} revalidated, "
+              f"{self.page_stats['loaded']} loaded in the browser")
+        if self.usage.skipped:
+            print(f"Budget exhausted, calls skipped: {self.usage.skipped}")
+        
+        if self.partial:
+            print("Deadline reached: outputs are partial")
+        
+        if self.checkpoint.reused:
+            print(f"Resumed {self.checkpoint.reused} completed units from {self.checkpoint.path}")
+        
+        if self.rephrase_stats['batch_calls']:
+            print(f"Rephrasing: {self.rephrase_stats['batched']} statements in {self.rephrase_stats['batch_calls']} "
+                  f"batched calls, {self.rephrase_stats['single']} single calls")
+        
+        clusters = self.query_clusters.report()
+        if clusters['searches_saved']:
+            print(f"Query clusters: {clusters['statements']} statements searched as {clusters['clusters']} queries")
+        
+        if any(self.dedupe_stats.values()):
+            print(f"Near-duplicates: {self.dedupe_stats['snippet_mirrors']} collapsed from snippets, "
+                  f"{self.dedupe_stats['content_mirrors']} from extracted content")
+        
+        print(f"Trust scores: {self.trust_stats['domain_prior']} from domain priors, {self.trust_stats['llm']} from Gemini")
+        
+        if self.prefilter:
+            report = self.prefilter.report()
+            print(f"Lexical pre-filter: {report['links_scored']} scored, {report['auto_rejected']} rejected, "
+                  f"{report['auto_accepted']} accepted, {report['llm_relevance_calls']} sent to Gemini")
         print("="*60)
     
     def cleanup(self):
-        if hasattr(self, 'driver'):
-            try:
-                self.driver.quit()
-            except:
-                pass
+        # Shared resources outlive the run and are closed by their owner
+        if self.owns_resources:
+            self.resources.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Search, filter and score links for the statements in data/")
+    parser.add_argument('--resume', action='store_true', help='Reuse units finished by an interrupted run')
+    args = parser.parse_args()
+    
     system = RelevanceSearchSystem()
     try:
-        system.process_all_files()
+        system.process_all_files(resume=args.resume)
     finally:
         system.cleanup()
 
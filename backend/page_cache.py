@@ -0,0 +1,79 @@
+"""
+Persistent cache of extracted page text with HTTP validators for conditional revalidation
+"""
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+PAGE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_cache (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    content TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+"""
+
+TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def normalize_url(url: str) -> str:
+    """Lower-case scheme and host, drop default ports, fragments and tracking parameters, sort the query"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+class PageCache:
+    def __init__(self, db_path: str = "results.db"):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(PAGE_CACHE_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'PageCache':
+        return cls(config.get('storage_settings', {}).get('database', 'results.db'))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM page_cache WHERE url_key = ?", (normalize_url(url),)).fetchone()
+        return dict(row) if row else None
+
+    def put(self, url: str, content: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO page_cache (url_key, url, content, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), url, content, etag, last_modified, time.time())
+            )
+
+    def touch(self, url: str) -> None:
+        """A 304 confirmed the stored text is current; restart its freshness window"""
+        with self._connect() as conn:
+            conn.execute("UPDATE page_cache SET fetched_at = ? WHERE url_key = ?", (time.time(), normalize_url(url)))
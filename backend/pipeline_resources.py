@@ -0,0 +1,108 @@
+"""
+Process-wide analysis resources: built once, shared by every run, health-checked and replaced when they die
+"""
+import json
+import os
+import threading
+from typing import Any, Dict
+
+import google.generativeai as genai
+import httpx
+from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+
+from browser_pool import BROWSER_USER_AGENT, BrowserPool
+from circuit_breaker import breakers
+from extraction_scheduler import PoliteScheduler
+from page_cache import PageCache
+from result_store import ResultStore
+
+
+BREAKER_NAMES = ('gemini', 'search', 'extraction')
+
+
+class PipelineResources:
+    """
+    Config, Custom Search client, Gemini model, stores, page-revalidation HTTP client, browser pool and
+    extraction scheduler. Only the per-run state (topic, context, keywords, checkpoint, budgets) lives
+    on RelevanceSearchSystem.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        # Prefer environment variables in production, fallback to config.json for local/dev
+        self.api_key = os.getenv("GOOGLE_API_KEY", config.get('api_key', ''))
+        self.search_engine_id = os.getenv("SEARCH_ENGINE_ID", config.get('search_engine_id', ''))
+
+        breakers.configure(config.get('circuit_breaker_settings'))
+        # Registered up front so /status lists them before the first call
+        for name in BREAKER_NAMES:
+            breakers.get(name)
+
+        self.search_service = build("customsearch", "v1", developerKey=self.api_key) if self.api_key else None
+        # httplib2 connections are not thread-safe, so concurrent runs each search over their own
+        self._search_local = threading.local()
+
+        self.gemini_model = None
+        self._init_gemini()
+
+        self.store = ResultStore.from_config(config)
+        self.page_cache = PageCache.from_config(config) if config.get('page_cache_settings', {}).get('enabled', True) else None
+        self.http_client = self._new_http_client()
+
+        # Extractions from every run share one per-host politeness schedule; one browser per worker at most
+        self.extractor = PoliteScheduler.from_config(config)
+        self.browsers = BrowserPool(self.extractor.workers)
+        self.health_checks = 0
+
+    @classmethod
+    def from_path(cls, config_path: str = "config.json") -> 'PipelineResources':
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _init_gemini(self) -> None:
+        # Configure Gemini if API key is available; otherwise run in degraded mode
+        try:
+            if self.api_key:
+                genai.configure(api_key=self.api_key)
+                self.gemini_model = genai.GenerativeModel(
+                    model_name=self.config['gemini_settings']['model']
+                )
+            else:
+                print("Warning: GOOGLE_API_KEY not set; Gemini features disabled.\n")
+        except Exception as e:
+            print(f"Warning: Could not initialize Gemini model: {str(e)}\n")
+
+    @staticmethod
+    def _new_http_client() -> httpx.Client:
+        return httpx.Client(follow_redirects=True, headers={'User-Agent': BROWSER_USER_AGENT})
+
+    def search_http(self):
+        """This thread's connection for Custom Search calls"""
+        http = getattr(self._search_local, 'http', None)
+        if http is None:
+            http = self._search_local.http = build_http()
+        return http
+
+    def check_health(self) -> Dict[str, Any]:
+        """Replace whatever has died since the last check; safe to call while runs are in flight"""
+        self.health_checks += 1
+        if self.http_client.is_closed:
+            self.http_client = self._new_http_client()
+        if self.api_key and self.gemini_model is None:
+            self._init_gemini()
+        self.browsers.check_health()
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'search': self.search_service is not None,
+            'gemini': self.gemini_model is not None,
+            'browsers': self.browsers.snapshot(),
+            'health_checks': self.health_checks
+        }
+
+    def close(self) -> None:
+        self.extractor.shutdown()
+        self.http_client.close()
+        self.browsers.close()
@@ -0,0 +1,52 @@
+"""
+Run-wide clustering of rephrased search queries, so statements that differ only in wording share one search
+"""
+from typing import Any, Dict, List, Optional, Set
+
+from text_utils import jaccard, token_set
+
+
+class QueryClusters:
+    """
+    Greedy leader clustering: a query joins the most similar existing cluster whose leader query it
+    matches at or above threshold (Jaccard over content-word stems), otherwise it leads a new cluster.
+    """
+
+    def __init__(self, threshold: float = 0.7):
+        self.threshold = threshold
+        self.leaders: List[Set[str]] = []
+        self.search_results: List[List[Dict[str, Any]]] = []
+        self.members: List[int] = []
+        # Stem -> clusters whose leader contains it; only clusters sharing a stem are compared
+        self.by_term: Dict[str, List[int]] = {}
+
+    def find(self, query: str) -> Optional[int]:
+        terms = token_set(query)
+        candidates = {cluster for term in terms for cluster in self.by_term.get(term, ())}
+        best, best_similarity = None, self.threshold
+        for cluster in sorted(candidates):
+            similarity = jaccard(terms, self.leaders[cluster])
+            if similarity >= best_similarity:
+                best, best_similarity = cluster, similarity
+        return best
+
+    def join(self, cluster: int) -> List[Dict[str, Any]]:
+        self.members[cluster] += 1
+        return self.search_results[cluster]
+
+    def add(self, query: str, search_results: List[Dict[str, Any]]) -> int:
+        cluster = len(self.leaders)
+        terms = token_set(query)
+        self.leaders.append(terms)
+        self.search_results.append(search_results)
+        self.members.append(1)
+        for term in terms:
+            self.by_term.setdefault(term, []).append(cluster)
+        return cluster
+
+    def report(self) -> Dict[str, int]:
+        return {
+            'clusters': len(self.leaders),
+            'statements': sum(self.members),
+            'searches_saved': sum(self.members) - len(self.leaders)
+        }
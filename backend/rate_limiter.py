@@ -0,0 +1,85 @@
+"""
+Token-bucket rate limiter shared by every process that points at the same SQLite database
+"""
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+
+RATE_LIMIT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def shared_gemini_rate(config: Dict[str, Any]) -> float:
+    """Requests per minute of the shared 'gemini' bucket; debates and batch workers refill it at this one rate"""
+    return config.get('rate_limiting', {}).get('gemini_requests_per_minute', 60)
+
+
+class SharedRateLimiter:
+    def __init__(self, db_path: str, name: str, requests_per_minute: float, burst: Optional[float] = None):
+        self.db_path = db_path
+        self.name = name
+        self.rate = requests_per_minute / 60.0
+        # Roughly one second of quota by default, so workers cannot all fire at once after an idle period
+        self.capacity = burst if burst is not None else max(1.0, self.rate)
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(RATE_LIMIT_SCHEMA)
+        finally:
+            conn.close()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], name: str, requests_per_minute: float) -> 'SharedRateLimiter':
+        return cls(config.get('storage_settings', {}).get('database', 'results.db'), name, requests_per_minute)
+
+    def _try_acquire(self) -> float:
+        """Take one token if available; otherwise return how long to wait before the next one"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute("SELECT tokens, updated_at FROM rate_limits WHERE name = ?", (self.name,)).fetchone()
+            tokens = self.capacity if row is None else min(self.capacity, row[0] + (now - row[1]) * self.rate)
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (self.name, tokens, now)
+            )
+            conn.execute("COMMIT")
+            return wait
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Block until a token is granted; returns the total time spent waiting, or None without a token
+        once the next one would arrive after timeout seconds
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return waited
+            if timeout is not None and waited + wait > timeout:
+                return None
+            time.sleep(wait)
+            waited += wait
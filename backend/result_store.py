@@ -0,0 +1,429 @@
+"""
+Embedded SQLite store for analysis results (topics, statements, links, extracted content)
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT,
+    topic TEXT NOT NULL,
+    processed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_topics_topic ON topics(topic);
+CREATE INDEX IF NOT EXISTS idx_topics_job ON topics(job_id);
+
+CREATE TABLE IF NOT EXISTS statements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic_id INTEGER NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
+    perspective TEXT NOT NULL,
+    source_file TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    bias_x REAL,
+    significance_y REAL,
+    combined_score REAL,
+    color TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_statements_topic ON statements(topic_id, perspective, position);
+
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    statement_id INTEGER NOT NULL REFERENCES statements(id) ON DELETE CASCADE,
+    topic_id INTEGER NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
+    perspective TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    url TEXT,
+    snippet TEXT,
+    relevance_confidence REAL,
+    trust_score REAL,
+    source_type TEXT,
+    mirror_count INTEGER NOT NULL DEFAULT 0,
+    mirror_links TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_links_topic ON links(topic_id, perspective);
+CREATE INDEX IF NOT EXISTS idx_links_statement ON links(statement_id, position);
+CREATE INDEX IF NOT EXISTS idx_links_trust ON links(trust_score);
+CREATE INDEX IF NOT EXISTS idx_links_url ON links(url);
+
+CREATE TABLE IF NOT EXISTS extracted_content (
+    link_id INTEGER PRIMARY KEY REFERENCES links(id) ON DELETE CASCADE,
+    content TEXT
+);
+
+CREATE TABLE IF NOT EXISTS domain_trust (
+    domain TEXT PRIMARY KEY,
+    observations INTEGER NOT NULL,
+    score_sum REAL NOT NULL,
+    source_type TEXT,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS trust_divergence (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT,
+    topic TEXT,
+    estimate INTEGER NOT NULL,
+    verdict INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS convergence_decisions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT,
+    round INTEGER NOT NULL,
+    score REAL NOT NULL,
+    local_decision TEXT NOT NULL,
+    llm_ready INTEGER,
+    ready INTEGER NOT NULL,
+    signals TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    cache_key TEXT PRIMARY KEY,
+    topic_id INTEGER NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class ResultStore:
+    def __init__(self, db_path: str = "results.db"):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # Databases created before near-duplicate collapsing lack the mirror columns
+            link_columns = {row['name'] for row in conn.execute("PRAGMA table_info(links)")}
+            if 'mirror_count' not in link_columns:
+                conn.execute("ALTER TABLE links ADD COLUMN mirror_count INTEGER NOT NULL DEFAULT 0")
+                conn.execute("ALTER TABLE links ADD COLUMN mirror_links TEXT")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ResultStore':
+        return cls(config.get('storage_settings', {}).get('database', 'results.db'))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the store safe to share across threads
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # Writers
+
+    def write_analysis(
+        self,
+        topic: str,
+        outputs: Dict[str, Dict[str, Any]],
+        job_id: Optional[str] = None,
+        processed_at: Optional[str] = None
+    ) -> int:
+        """Bulk-insert one run's per-perspective outputs in a single transaction; re-writing a job replaces it"""
+        processed_at = processed_at or datetime.now().isoformat()
+
+        with self._connect() as conn:
+            if job_id is not None:
+                conn.execute("DELETE FROM topics WHERE job_id = ?", (job_id,))
+
+            topic_id = conn.execute(
+                "INSERT INTO topics (job_id, topic, processed_at) VALUES (?, ?, ?)",
+                (job_id, topic, processed_at)
+            ).lastrowid
+
+            for perspective, output_data in outputs.items():
+                source_file = output_data.get('source_file', f'{perspective}.json')
+                for position, item in enumerate(output_data.get('items', [])):
+                    statement_id = conn.execute(
+                        "INSERT INTO statements (topic_id, perspective, source_file, position, text, bias_x, "
+                        "significance_y, combined_score, color) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (topic_id, perspective, source_file, position, item.get('text', ''),
+                         item.get('bias_x'), item.get('significance_y'), item.get('combined_score'),
+                         item.get('color', ''))
+                    ).lastrowid
+
+                    for link_position, link in enumerate(item.get('relevant_links', [])):
+                        link_id = conn.execute(
+                            "INSERT INTO links (statement_id, topic_id, perspective, position, title, url, snippet, "
+                            "relevance_confidence, trust_score, source_type, mirror_count, mirror_links) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (statement_id, topic_id, perspective, link_position, link.get('title', ''),
+                             link.get('link', ''), link.get('snippet', ''), link.get('relevance_confidence'),
+                             link.get('trust_score'), link.get('source_type', 'Unknown'), link.get('mirror_count', 0),
+                             json.dumps(link['mirror_links']) if link.get('mirror_links') else None)
+                        ).lastrowid
+                        if 'extracted_content' in link:
+                            conn.execute(
+                                "INSERT INTO extracted_content (link_id, content) VALUES (?, ?)",
+                                (link_id, link['extracted_content'])
+                            )
+
+        return topic_id
+
+    def import_json_files(self, paths: Dict[str, str], job_id: Optional[str] = None) -> Optional[int]:
+        """Load legacy relevant_*.json documents (perspective -> path) into the store"""
+        outputs = {}
+        for perspective, path in paths.items():
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    outputs[perspective] = json.load(f)
+        if not outputs:
+            return None
+
+        first = next(iter(outputs.values()))
+        return self.write_analysis(first.get('topic', ''), outputs, job_id=job_id, processed_at=first.get('processed_at'))
+
+    def put_cached_analysis(self, cache_key: str, topic_id: int) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (cache_key, topic_id, created_at) VALUES (?, ?, ?)",
+                (cache_key, topic_id, time.time())
+            )
+
+    def observe_domain_trust(self, domain: str, trust_score: float, source_type: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO domain_trust (domain, observations, score_sum, source_type, updated_at) "
+                "VALUES (?, 1, ?, ?, ?) ON CONFLICT(domain) DO UPDATE SET "
+                "observations = observations + 1, score_sum = score_sum + excluded.score_sum, "
+                "source_type = excluded.source_type, updated_at = excluded.updated_at",
+                (domain, trust_score, source_type, time.time())
+            )
+
+    def record_trust_divergence(self, job_id: Optional[str], topic: str, estimate: int, verdict: int) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO trust_divergence (job_id, topic, estimate, verdict, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, topic, estimate, verdict, time.time())
+            )
+
+    def record_convergence_decisions(self, job_id: Optional[str], decisions: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO convergence_decisions "
+                "(job_id, round, score, local_decision, llm_ready, ready, signals, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        job_id, d['round'], d['score'], d['decision'],
+                        None if d['llm_ready'] is None else int(d['llm_ready']), int(d['ready']),
+                        json.dumps({k: d[k] for k in ('lexical_novelty', 'repetition', 'new_sources')}), now
+                    )
+                    for d in decisions
+                ]
+            )
+
+    # Queries
+
+    def trust_divergence_stats(self) -> Dict[str, Any]:
+        """How far judge verdicts land from the provisional estimates (verdict minus estimate, in points)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS debates, AVG(verdict - estimate) AS mean_divergence, "
+                "AVG(ABS(verdict - estimate)) AS mean_abs_divergence, MAX(ABS(verdict - estimate)) AS max_abs_divergence "
+                "FROM trust_divergence"
+            ).fetchone()
+        return {
+            'debates': row['debates'],
+            'mean_divergence': round(row['mean_divergence'], 2) if row['debates'] else None,
+            'mean_abs_divergence': round(row['mean_abs_divergence'], 2) if row['debates'] else None,
+            'max_abs_divergence': row['max_abs_divergence']
+        }
+
+    def convergence_stats(self) -> Dict[str, Any]:
+        """Local decisions by outcome, and the local score against the LLM's answer wherever the LLM was asked"""
+        with self._connect() as conn:
+            decisions = conn.execute(
+                "SELECT local_decision, COUNT(*) AS n FROM convergence_decisions GROUP BY local_decision"
+            ).fetchall()
+            checked = conn.execute(
+                "SELECT llm_ready, COUNT(*) AS n, AVG(score) AS mean_score, MIN(score) AS min_score, MAX(score) AS max_score "
+                "FROM convergence_decisions WHERE llm_ready IS NOT NULL GROUP BY llm_ready"
+            ).fetchall()
+        return {
+            'local_decisions': {row['local_decision']: row['n'] for row in decisions},
+            'llm_checks': {
+                ('ready' if row['llm_ready'] else 'continue'): {
+                    'rounds': row['n'],
+                    'mean_score': round(row['mean_score'], 4),
+                    'min_score': round(row['min_score'], 4),
+                    'max_score': round(row['max_score'], 4)
+                }
+                for row in checked
+            }
+        }
+
+    def learned_domain_trust(self) -> Dict[str, Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT domain, observations, score_sum, source_type FROM domain_trust").fetchall()
+        return {
+            row['domain']: {
+                'observations': row['observations'],
+                'score_sum': row['score_sum'],
+                'source_type': row['source_type'] or 'Unknown'
+            }
+            for row in rows
+        }
+
+    def cached_analysis(self, cache_key: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+        """Topic row stored under cache_key if it is younger than max_age_seconds"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT t.* FROM analysis_cache c JOIN topics t ON t.id = c.topic_id "
+                "WHERE c.cache_key = ? AND c.created_at >= ?",
+                (cache_key, time.time() - max_age_seconds)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def latest_topic_id(self, job_id: Optional[str] = None) -> Optional[int]:
+        with self._connect() as conn:
+            if job_id is None:
+                row = conn.execute("SELECT id FROM topics ORDER BY id DESC LIMIT 1").fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT id FROM topics WHERE job_id = ? ORDER BY id DESC LIMIT 1", (job_id,)
+                ).fetchone()
+        return row['id'] if row else None
+
+    def statement_counts(self, topic_id: int) -> Dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT perspective, COUNT(*) AS n FROM statements WHERE topic_id = ? GROUP BY perspective",
+                (topic_id,)
+            ).fetchall()
+        return {row['perspective']: row['n'] for row in rows}
+
+    def result_links(self, topic_id: int) -> List[Dict[str, Any]]:
+        """Flat link rows in the /results shape"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT l.title, l.url, l.snippet, l.trust_score, l.source_type, l.relevance_confidence, l.mirror_count, "
+                "l.perspective "
+                "FROM links l JOIN statements s ON s.id = l.statement_id "
+                "WHERE l.topic_id = ? ORDER BY l.perspective, s.position, l.position",
+                (topic_id,)
+            ).fetchall()
+        return [
+            {
+                'title': row['title'],
+                'url': row['url'],
+                'snippet': row['snippet'],
+                'trust_score': row['trust_score'] if row['trust_score'] is not None else 0.5,
+                'source_type': row['source_type'] or 'Unknown',
+                'relevance_confidence': row['relevance_confidence'],
+                'mirror_count': row['mirror_count'],
+                'perspective': row['perspective']
+            }
+            for row in rows
+        ]
+
+    def search_items(self, topic_id: int, perspective: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Statement-link pairs in the dummy server's search_items shape"""
+        query = (
+            "SELECT s.text, s.bias_x, s.significance_y, s.combined_score, l.title, l.url, l.snippet, "
+            "l.trust_score, l.source_type, l.perspective "
+            "FROM links l JOIN statements s ON s.id = l.statement_id WHERE l.topic_id = ?"
+        )
+        params: List[Any] = [topic_id]
+        if perspective is not None:
+            query += " AND l.perspective = ?"
+            params.append(perspective)
+        query += " ORDER BY l.perspective, s.position, l.position"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            {
+                'text': row['text'],
+                'bias_x': row['bias_x'] if row['bias_x'] is not None else 0.5,
+                'significance_y': row['significance_y'] if row['significance_y'] is not None else 0.5,
+                'combined_score': row['combined_score'] if row['combined_score'] is not None else 0.25,
+                'link_title': row['title'],
+                'link_url': row['url'],
+                'link_snippet': row['snippet'],
+                'trust_score': row['trust_score'] if row['trust_score'] is not None else 0.5,
+                'source_type': row['source_type'] or 'Unknown',
+                'perspective': row['perspective']
+            }
+            for row in rows
+        ]
+
+    def export_document(
+        self,
+        topic_id: int,
+        perspective: str,
+        content_chars: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """One perspective in the relevant_*.json document shape; content_chars truncates extracted content in SQL"""
+        content_column = "c.content" if content_chars is None else f"substr(c.content, 1, {int(content_chars)})"
+
+        with self._connect() as conn:
+            topic_row = conn.execute("SELECT * FROM topics WHERE id = ?", (topic_id,)).fetchone()
+            if topic_row is None:
+                return None
+            statements = conn.execute(
+                "SELECT * FROM statements WHERE topic_id = ? AND perspective = ? ORDER BY position",
+                (topic_id, perspective)
+            ).fetchall()
+            if not statements:
+                return None
+            links = conn.execute(
+                f"SELECT l.*, {content_column} AS content, c.link_id AS has_content "
+                "FROM links l LEFT JOIN extracted_content c ON c.link_id = l.id "
+                "WHERE l.topic_id = ? AND l.perspective = ? ORDER BY l.statement_id, l.position",
+                (topic_id, perspective)
+            ).fetchall()
+
+        links_by_statement: Dict[int, List[Dict[str, Any]]] = {}
+        for row in links:
+            link = {
+                'title': row['title'],
+                'link': row['url'],
+                'snippet': row['snippet'],
+                'relevance_confidence': row['relevance_confidence'],
+                'trust_score': row['trust_score'],
+                'source_type': row['source_type']
+            }
+            if row['mirror_count']:
+                link['mirror_count'] = row['mirror_count']
+                link['mirror_links'] = json.loads(row['mirror_links'])
+            if row['has_content'] is not None:
+                link['extracted_content'] = row['content']
+            links_by_statement.setdefault(row['statement_id'], []).append(link)
+
+        items = [
+            {
+                'text': row['text'],
+                'bias_x': row['bias_x'],
+                'significance_y': row['significance_y'],
+                'combined_score': row['combined_score'],
+                'color': row['color'],
+                'relevant_links': links_by_statement.get(row['id'], [])
+            }
+            for row in statements
+        ]
+
+        return {
+            'topic': topic_row['topic'],
+            'source_file': statements[0]['source_file'],
+            'processed_at': topic_row['processed_at'],
+            'total_items': len(items),
+            'items': items
+        }
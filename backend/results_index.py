@@ -0,0 +1,81 @@
+"""
+Pre-flattened, pre-sorted index over analysis results for the /results endpoint
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+
+class ResultsIndex:
+    SORT_FIELDS = ('trust_score', 'relevance_confidence')
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+
+        self._by_perspective: Dict[str, set] = {}
+        self._by_source_type: Dict[str, set] = {}
+        for position, entry in enumerate(entries):
+            self._by_perspective.setdefault(entry['perspective'].lower(), set()).add(position)
+            self._by_source_type.setdefault(entry['source_type'].lower(), set()).add(position)
+
+        # Descending orders are built once; ascending requests walk them backwards
+        self._sorted: Dict[str, List[int]] = {}
+        for field in self.SORT_FIELDS:
+            self._sorted[field] = sorted(
+                range(len(entries)),
+                key=lambda position: self._sort_value(entries[position], field),
+                reverse=True
+            )
+
+        digest = hashlib.sha1(json.dumps(entries, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        self.version = digest.hexdigest()[:16]
+
+    @staticmethod
+    def _sort_value(entry: Dict[str, Any], field: str) -> float:
+        value = entry.get(field)
+        return value if isinstance(value, (int, float)) else -1.0
+
+    def etag(self, **params: Any) -> str:
+        """Strong ETag for one query: index version plus the normalized query parameters"""
+        query = json.dumps({k: v for k, v in params.items() if v is not None}, sort_keys=True)
+        return f'"{self.version}-{hashlib.sha1(query.encode("utf-8")).hexdigest()[:8]}"'
+
+    def query(
+        self,
+        perspective: Optional[str] = None,
+        source_type: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        order: str = 'desc',
+        page: int = 1,
+        page_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        if sort_by is not None and sort_by not in self.SORT_FIELDS:
+            raise ValueError(f"sort_by must be one of {', '.join(self.SORT_FIELDS)}")
+
+        selected: Optional[set] = None
+        if perspective:
+            selected = self._by_perspective.get(perspective.lower(), set())
+        if source_type:
+            matches = self._by_source_type.get(source_type.lower(), set())
+            selected = matches if selected is None else selected & matches
+
+        if sort_by:
+            ordering = self._sorted[sort_by]
+            if order == 'asc':
+                ordering = ordering[::-1]
+        else:
+            ordering = range(len(self.entries))
+
+        positions = [p for p in ordering if selected is None or p in selected]
+        total = len(positions)
+
+        if page_size:
+            start = (page - 1) * page_size
+            positions = positions[start:start + page_size]
+
+        return {
+            'results': [self.entries[p] for p in positions],
+            'total': total,
+            'page': page,
+            'page_size': page_size or total
+        }
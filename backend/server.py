@@ -1,27 +1,103 @@
 """
 FastAPI API server for Information Trust Analysis System
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from contextlib import asynccontextmanager
 import os
 import json
 import uvicorn
-import requests
-from typing import Dict, Any
+import httpx
+from typing import Dict, Any, Optional, Tuple
 import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from analysis_cache import analysis_cache_key, cache_max_age
+from async_cache import AsyncTTLCache
+from circuit_breaker import breakers
+from deadline import Deadline
+from llm_gate import FairLLMGate
+from result_store import ResultStore
+from results_index import ResultsIndex
+from state_store import SQLiteStateStore
+from trust_estimate import estimate_trust
+from workspace import Workspace
+
 # Import your analysis classes
 try:
     from main import RelevanceSearchSystem
     from debate import DebateOrchestrator
+    from pipeline_resources import PipelineResources
 except ImportError as e:
     print(f"Warning: Could not import analysis modules: {e}")
     RelevanceSearchSystem = None
     DebateOrchestrator = None
+    PipelineResources = None
+
+CONFIG_PATH = os.environ.get("CONFIG_PATH", "config.json")
+
+# Dummy server configuration
+DUMMY_SERVER_URL = "http://localhost:8001"
+UPSTREAM_TIMEOUT = 5.0
+UPSTREAM_CACHE_TTL = float(os.environ.get("UPSTREAM_CACHE_TTL", 30))
+
+upstream_cache = AsyncTTLCache(ttl_seconds=UPSTREAM_CACHE_TTL)
+
+def load_config() -> Dict[str, Any]:
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+async def watch_resources(resources: Any, interval: float):
+    """Periodically replace dead browsers and clients between and during analyses"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(resources.check_health)
+        except Exception as e:
+            print(f"Warning: Resource health check failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the shared stores and one keep-alive HTTP client for the lifetime of the app"""
+    config = load_config()
+    app.state.result_store = ResultStore.from_config(config)
+    app.state.state_store = SQLiteStateStore.from_config(config)
+    breakers.configure(config.get("circuit_breaker_settings"))
+    # Every debate in this worker, queued or synchronous, takes turns under one Gemini concurrency cap
+    app.state.llm_gate = FairLLMGate.from_config(config)
+    app.state.debate_executor = ThreadPoolExecutor(
+        max_workers=config.get("debate_settings", {}).get("max_parallel_debates", 8),
+        thread_name_prefix="debate"
+    )
+    app.state.http_client = httpx.AsyncClient(
+        base_url=DUMMY_SERVER_URL,
+        timeout=UPSTREAM_TIMEOUT,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    # Search client, Gemini model, browsers and extraction workers are started once and shared by every analysis
+    app.state.resources = None
+    health_task = None
+    if RelevanceSearchSystem and PipelineResources:
+        app.state.resources = await run_in_threadpool(PipelineResources, config)
+        health_task = asyncio.create_task(watch_resources(
+            app.state.resources, config.get("resource_settings", {}).get("health_check_seconds", 60)
+        ))
+    try:
+        yield
+    finally:
+        if health_task:
+            health_task.cancel()
+        app.state.debate_executor.shutdown(wait=False, cancel_futures=True)
+        await app.state.http_client.aclose()
+        if app.state.resources:
+            await run_in_threadpool(app.state.resources.close)
 
-app = FastAPI(title="Information Trust Analysis System")
+app = FastAPI(title="Information Trust Analysis System", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -32,9 +108,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Dummy server configuration
-DUMMY_SERVER_URL = "http://localhost:8001"
-
 # CORS configuration for separate frontend hosting
 app.add_middleware(
     CORSMiddleware,
@@ -49,6 +122,15 @@ class AnalysisInput(BaseModel):
     topic: str
     text: str = ""
     significance_score: float = 0.8
+    force_refresh: bool = False
+    deadline_seconds: Optional[float] = Field(default=None, ge=0)
+    # Client-chosen id so /jobs/{job_id}/stream can be polled while /process is still running
+    job_id: Optional[str] = Field(default=None, pattern=r"^[A-Za-z0-9_-]{1,64}$")
+
+class DebateJobInput(BaseModel):
+    # Analysis job whose results are debated; defaults to the current analysis
+    analysis_job_id: Optional[str] = None
+    job_id: Optional[str] = Field(default=None, pattern=r"^[A-Za-z0-9_-]{1,64}$")
 
 class DummyServerRequest(BaseModel):
     perspective: str = "all"
@@ -58,9 +140,65 @@ class AnalysisStatus(BaseModel):
     message: str
     progress: float = 0.0
 
-# Global state
-current_analysis = None
-analysis_results = []
+# Per-worker /results index, rebuilt only when the shared current analysis points at a new topic
+results_index = None
+results_index_topic_id = None
+
+def job_workspace(job_id: str) -> Workspace:
+    job = app.state.state_store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'")
+    # Debate jobs point at the workspace of the analysis they debate
+    return Workspace.open_job(os.path.basename(job["workspace_dir"]), jobs_root=os.path.dirname(job["workspace_dir"]))
+
+def resolve_workspace(job_id: Optional[str], current_name: str) -> Workspace:
+    """Workspace for an explicit job id, else the shared current job, else the legacy working-directory layout"""
+    if job_id is None:
+        job_id = app.state.state_store.get_current(current_name)
+        if job_id is None:
+            return Workspace()
+    return job_workspace(job_id)
+
+def publish_analysis(workspace: Workspace, topic_id: int, partial: bool = False, usage: Optional[Dict[str, Any]] = None) -> None:
+    """Make a stored analysis the current one for every worker"""
+    state_store = app.state.state_store
+    fields = {"status": "partial" if partial else "completed", "topic_id": topic_id}
+    if usage is not None:
+        fields["result"] = {"usage": usage}
+    state_store.update_job(workspace.job_id, **fields)
+    state_store.set_current("analysis", workspace.job_id)
+
+def current_results_index() -> ResultsIndex:
+    global results_index, results_index_topic_id
+    
+    job_id = app.state.state_store.get_current("analysis")
+    job = app.state.state_store.get_job(job_id) if job_id else None
+    if job is None or job["topic_id"] is None:
+        return SAMPLE_RESULTS_INDEX
+    
+    if job["topic_id"] != results_index_topic_id:
+        results_index = ResultsIndex(app.state.result_store.result_links(job["topic_id"]))
+        results_index_topic_id = job["topic_id"]
+    return results_index
+
+def cached_analysis(cache_key: str, max_age: float) -> Optional[Tuple[Workspace, int]]:
+    """Workspace and topic id of a fresh cached analysis whose job files still exist"""
+    cached = app.state.result_store.cached_analysis(cache_key, max_age)
+    if cached is None or not cached["job_id"] or app.state.state_store.get_job(cached["job_id"]) is None:
+        return None
+    workspace = job_workspace(cached["job_id"])
+    if not os.path.exists(workspace.input_path):
+        return None
+    return workspace, cached["id"]
+
+def run_analysis(workspace: Workspace, deadline: Deadline) -> Dict[str, Any]:
+    """Run one analysis inside its own workspace; returns its topic id, partial flag and usage report"""
+    system = RelevanceSearchSystem(workspace=workspace, resources=app.state.resources)
+    try:
+        system.process_all_files(deadline=deadline)
+    finally:
+        system.cleanup()
+    return {"topic_id": system.topic_id, "partial": system.partial, "usage": system.usage.report()}
 
 @app.get("/")
 async def root():
@@ -74,6 +212,10 @@ async def root():
             "process": "/process",
             "results": "/results",
             "debate": "/debate",
+            "debate_stream": "/debate/stream",
+            "debate_jobs": "/debate/jobs",
+            "trust_estimate": "/trust-estimate",
+            "jobs": "/jobs/{job_id}",
             "status": "/status"
         }
     }
@@ -83,37 +225,34 @@ async def favicon():
     """Return a simple favicon to prevent 404 errors"""
     return HTTPException(status_code=204, detail="No favicon")
 
+async def fetch_upstream_json(path: str) -> Any:
+    """GET a dummy server path through the shared client, cached and de-duplicated per path"""
+    async def load():
+        response = await app.state.http_client.get(path)
+        response.raise_for_status()
+        return response.json()
+
+    return await upstream_cache.get_or_fetch(path, load)
+
 @app.get("/load-sample-data")
 async def load_sample_data():
     """Load sample data from dummy server for the frontend"""
-    print(f"[DEBUG] load_sample_data endpoint called")
-    print(f"[DEBUG] Attempting to connect to dummy server at: {DUMMY_SERVER_URL}")
-    
     try:
-        print(f"[DEBUG] Making request to: {DUMMY_SERVER_URL}/data/sample-input")
-        
-        # Get sample input data from dummy server
-        input_response = requests.get(f"{DUMMY_SERVER_URL}/data/sample-input", timeout=5)
-        print(f"[DEBUG] Sample input response status: {input_response.status_code}")
-        
-        if input_response.status_code != 200:
-            raise HTTPException(status_code=input_response.status_code, detail=f"Dummy server returned {input_response.status_code} for sample input")
+        # Sample input and perspective counts are independent, fetch them concurrently
+        sample_input, perspectives_data = await asyncio.gather(
+            fetch_upstream_json("/data/sample-input"),
+            fetch_upstream_json("/data/perspectives/all"),
+            return_exceptions=True
+        )
         
-        sample_input = input_response.json()
-        print(f"[DEBUG] Sample input data: {sample_input}")
-        
-        # Get all perspectives data to show count
-        print(f"[DEBUG] Making request to: {DUMMY_SERVER_URL}/data/perspectives/all")
-        perspectives_response = requests.get(f"{DUMMY_SERVER_URL}/data/perspectives/all", timeout=5)
-        print(f"[DEBUG] Perspectives response status: {perspectives_response.status_code}")
+        if isinstance(sample_input, BaseException):
+            raise sample_input
         
         total_items = 0
-        if perspectives_response.status_code == 200:
-            perspectives_data = perspectives_response.json()
+        if not isinstance(perspectives_data, BaseException):
             total_items = perspectives_data.get("total_search_items", 0)
-            print(f"[DEBUG] Total items found: {total_items}")
         
-        result = {
+        return {
             "status": "success",
             "message": f"Sample data loaded from dummy server ({total_items} perspective items available)",
             "topic": sample_input.get("topic", ""),
@@ -123,10 +262,10 @@ async def load_sample_data():
             "timestamp": sample_input.get("timestamp", datetime.now().isoformat())
         }
         
-        print(f"[DEBUG] Returning result: {result}")
-        return result
-        
-    except requests.RequestException as e:
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        raise HTTPException(status_code=status_code, detail=f"Dummy server returned {status_code} for sample input")
+    except httpx.HTTPError as e:
         print(f"[ERROR] HTTP request error: {str(e)}")
         raise HTTPException(status_code=503, detail=f"Cannot connect to dummy server: {str(e)}")
     except Exception as e:
@@ -136,48 +275,70 @@ async def load_sample_data():
 @app.post("/process")
 async def start_analysis(input_data: AnalysisInput):
     """Start the information trust analysis process"""
-    global current_analysis, analysis_results
-    
     try:
-        # Save input data to file for main.py to process
         input_file_data = {
             "topic": input_data.topic,
             "text": input_data.text,
             "significance_score": input_data.significance_score
         }
         
-        # Update data/input.json
-        os.makedirs("data", exist_ok=True)
-        with open("data/input.json", "w", encoding="utf-8") as f:
-            json.dump(input_file_data, f, indent=2, ensure_ascii=False)
-        
         if RelevanceSearchSystem:
-            # Run analysis in background
+            store = app.state.result_store
+            config = app.state.resources.config
+            max_age = cache_max_age(config)
+            cache_key = analysis_cache_key(config, input_data.topic, input_data.text)
+            
+            # Identical topic, text, statement files and config within the freshness window reuse the stored run
+            if max_age > 0 and not input_data.force_refresh:
+                cached = cached_analysis(cache_key, max_age)
+                if cached is not None:
+                    workspace, topic_id = cached
+                    publish_analysis(workspace, topic_id)
+                    return {
+                        "status": "completed",
+                        "message": "Analysis served from cache",
+                        "job_id": workspace.job_id,
+                        "cached": True,
+                        "partial": False,
+                        "generated_files": len(store.statement_counts(topic_id)),
+                        "progress": 100.0
+                    }
+            
+            # Each job reads and writes only its own workspace, so analyses run side by side off the event loop
+            # The budget starts at submission so time waiting for a worker thread counts against it too
+            deadline_seconds = input_data.deadline_seconds
+            if deadline_seconds is None:
+                deadline_seconds = config.get("deadline_settings", {}).get("process_seconds")
+            deadline = Deadline(deadline_seconds)
+            
+            if input_data.job_id and app.state.state_store.get_job(input_data.job_id) is not None:
+                raise HTTPException(status_code=409, detail=f"Job '{input_data.job_id}' already exists")
+            workspace = Workspace.create_job(input_file_data, job_id=input_data.job_id)
+            app.state.state_store.create_job(workspace.job_id, "analysis", workspace.output_dir)
             try:
-                system = RelevanceSearchSystem()
-                results = system.process_all_files()
-                system.cleanup()
-                
-                # Load generated results
-                generated_files = []
-                for filename in ["relevant_common.json", "relevant_leftist.json", "relevant_rightist.json"]:
-                    if os.path.exists(filename):
-                        with open(filename, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            generated_files.append(data)
-                
-                analysis_results = generated_files
+                run = await run_in_threadpool(run_analysis, workspace, deadline)
+                topic_id, partial = run["topic_id"], run["partial"]
+                # Partial runs are served but never cached, so the next submission completes the work
+                if not partial:
+                    store.put_cached_analysis(cache_key, topic_id)
+                publish_analysis(workspace, topic_id, partial=partial, usage=run["usage"])
                 
                 return {
                     "status": "completed",
-                    "message": "Analysis completed successfully",
-                    "generated_files": len(generated_files),
+                    "message": "Analysis stopped at its deadline with partial results" if partial else "Analysis completed successfully",
+                    "job_id": workspace.job_id,
+                    "cached": False,
+                    "partial": partial,
+                    "usage": run["usage"],
+                    "generated_files": len(store.statement_counts(topic_id)),
                     "progress": 100.0
                 }
             except Exception as e:
+                app.state.state_store.update_job(workspace.job_id, status="error", error=str(e))
                 return {
                     "status": "error",
                     "message": f"Analysis failed: {str(e)}",
+                    "job_id": workspace.job_id,
                     "progress": 0.0
                 }
         else:
@@ -188,86 +349,161 @@ async def start_analysis(input_data: AnalysisInput):
                 "progress": 100.0
             }
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+# Demo results served until a real analysis completes
+SAMPLE_RESULTS_INDEX = ResultsIndex([
+    {
+        "title": "Wikipedia - Charles James Kirk",
+        "url": "https://en.wikipedia.org/wiki/Charles_James_Kirk",
+        "snippet": "Charles James Kirk (October 14, 1993 – September 10, 2025) was an American political activist...",
+        "trust_score": 0.75,
+        "source_type": "Encyclopedia",
+        "relevance_confidence": 0.95,
+        "perspective": "common"
+    },
+    {
+        "title": "Political Violence Analysis",
+        "url": "https://example-news.com/kirk-analysis",
+        "snippet": "The assassination highlights growing concerns about political violence...",
+        "trust_score": 0.68,
+        "source_type": "News Media",
+        "relevance_confidence": 0.87,
+        "perspective": "leftist"
+    },
+    {
+        "title": "Conservative Icon Remembered",
+        "url": "https://example-conservative.com/kirk-tribute",
+        "snippet": "Charles Kirk's legacy as a conservative voice continues...",
+        "trust_score": 0.71,
+        "source_type": "Opinion Blog",
+        "relevance_confidence": 0.82,
+        "perspective": "rightist"
+    }
+])
+
 @app.get("/results")
-async def get_results():
-    """Get analysis results"""
-    global analysis_results
+async def get_results(
+    request: Request,
+    perspective: Optional[str] = None,
+    source_type: Optional[str] = None,
+    sort_by: Optional[str] = Query(None, description="trust_score or relevance_confidence"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    page: int = Query(1, ge=1),
+    page_size: Optional[int] = Query(None, ge=1, le=500)
+):
+    """Get analysis results, optionally filtered, sorted and paginated"""
+    index = current_results_index()
     
-    if not analysis_results:
-        # Return sample results for demo
-        sample_results = [
-            {
-                "title": "Wikipedia - Charles James Kirk",
-                "url": "https://en.wikipedia.org/wiki/Charles_James_Kirk",
-                "snippet": "Charles James Kirk (October 14, 1993 – September 10, 2025) was an American political activist...",
-                "trust_score": 0.75,
-                "source_type": "Encyclopedia",
-                "relevance_confidence": 0.95,
-                "perspective": "common"
-            },
-            {
-                "title": "Political Violence Analysis",
-                "url": "https://example-news.com/kirk-analysis",
-                "snippet": "The assassination highlights growing concerns about political violence...",
-                "trust_score": 0.68,
-                "source_type": "News Media",
-                "relevance_confidence": 0.87,
-                "perspective": "leftist"
-            },
-            {
-                "title": "Conservative Icon Remembered",
-                "url": "https://example-conservative.com/kirk-tribute",
-                "snippet": "Charles Kirk's legacy as a conservative voice continues...",
-                "trust_score": 0.71,
-                "source_type": "Opinion Blog",
-                "relevance_confidence": 0.82,
-                "perspective": "rightist"
-            }
-        ]
-        return {"results": sample_results}
+    etag = index.etag(
+        perspective=perspective, source_type=source_type, sort_by=sort_by,
+        order=order, page=page, page_size=page_size
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     
-    # Process real results
-    processed_results = []
-    for file_data in analysis_results:
-        for item in file_data.get("items", []):
-            for link in item.get("relevant_links", []):
-                processed_results.append({
-                    "title": link.get("title", ""),
-                    "url": link.get("link", ""),
-                    "snippet": link.get("snippet", ""),
-                    "trust_score": link.get("trust_score", 0.5),
-                    "source_type": link.get("source_type", "Unknown"),
-                    "relevance_confidence": 0.8,  # Default value
-                    "perspective": file_data.get("source_file", "").replace(".json", "").replace("relevant_", "")
-                })
+    try:
+        content = index.query(
+            perspective=perspective, source_type=source_type, sort_by=sort_by,
+            order=order, page=page, page_size=page_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return {"results": processed_results}
+    return JSONResponse(content=content, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+async def prepare_debate_workspace(workspace: Workspace) -> None:
+    """Create sample relevant files for demo runs that have neither stored results nor files"""
+    stored = workspace.job_id is not None and app.state.result_store.latest_topic_id(job_id=workspace.job_id) is not None
+    missing_files = [p for p in workspace.relevant_paths.values() if not os.path.exists(p)]
+    
+    if missing_files and not stored:
+        await create_sample_relevant_files(workspace)
+
+def analysis_documents(workspace: Workspace) -> Dict[str, Dict[str, Any]]:
+    """Per-perspective relevant_*.json documents from the result store, else from the workspace files"""
+    store = app.state.result_store
+    topic_id = store.latest_topic_id(job_id=workspace.job_id) if workspace.job_id else None
+    documents = {}
+    for perspective, path in workspace.relevant_paths.items():
+        if topic_id is not None:
+            document = store.export_document(topic_id, perspective, content_chars=0)
+        elif os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        else:
+            document = None
+        if document is not None:
+            documents[perspective] = document
+    return documents
+
+def finish_debate(workspace: Workspace, result: Dict[str, Any], estimate: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the provisional estimate to the judge's result, record their divergence and publish it"""
+    verdict = result.get("trust_score", 50)
+    result["provisional_trust"] = estimate
+    result["trust_divergence"] = verdict - estimate["trust_score"]
+    
+    app.state.result_store.record_trust_divergence(workspace.job_id, result.get("topic", ""), estimate["trust_score"], verdict)
+    app.state.state_store.save_debate_result(workspace.job_id, result)
+    app.state.state_store.set_current("debate", workspace.job_id)
+    return result
+
+def run_debate(workspace: Workspace, owner: str) -> Dict[str, Any]:
+    orchestrator = DebateOrchestrator(
+        config_path=CONFIG_PATH, workspace=workspace, llm_gate=app.state.llm_gate, gate_owner=owner
+    )
+    return orchestrator.conduct_debate(max_rounds=3, min_rounds=1)
+
+def run_debate_job(debate_job_id: str, workspace: Workspace, estimate: Dict[str, Any]) -> None:
+    """Executor body of a queued debate; its outcome is reported only through the job record"""
+    state_store = app.state.state_store
+    state_store.update_job(debate_job_id, status="running")
+    try:
+        result = finish_debate(workspace, run_debate(workspace, debate_job_id), estimate)
+        state_store.update_job(debate_job_id, status="completed", result=result)
+    except Exception as e:
+        state_store.update_job(debate_job_id, status="error", error=str(e))
+
+@app.get("/trust-estimate")
+async def get_trust_estimate(job_id: Optional[str] = None):
+    """Provisional trust score computed from the analysis in milliseconds, without running a debate"""
+    workspace = resolve_workspace(job_id, "analysis")
+    return {"job_id": workspace.job_id, **estimate_trust(analysis_documents(workspace))}
+
+@app.get("/trust-estimate/divergence")
+async def get_trust_divergence():
+    """How far judge verdicts have landed from the provisional estimates"""
+    return app.state.result_store.trust_divergence_stats()
+
+@app.get("/debate/convergence")
+async def get_convergence_stats():
+    """Local convergence decisions against the LLM readiness answers, for calibrating convergence_settings"""
+    return app.state.result_store.convergence_stats()
 
 @app.post("/debate")
-async def start_debate():
+async def start_debate(job_id: Optional[str] = None):
     """Start the AI debate simulation"""
+    workspace = resolve_workspace(job_id, "analysis")
     try:
-        # Create sample relevant files if they don't exist (for demo)
-        required_files = ["relevant_common.json", "relevant_leftist.json", "relevant_rightist.json"]
-        missing_files = [f for f in required_files if not os.path.exists(f)]
-        
-        if missing_files:
-            # Create sample files for demo
-            await create_sample_relevant_files()
+        await prepare_debate_workspace(workspace)
         
         if DebateOrchestrator:
             try:
-                orchestrator = DebateOrchestrator()
-                result = orchestrator.conduct_debate(max_rounds=3, min_rounds=1)
+                estimate = estimate_trust(analysis_documents(workspace))
+                result = await run_in_threadpool(run_debate, workspace, workspace.job_id or uuid.uuid4().hex[:12])
+                result = finish_debate(workspace, result, estimate)
                 
                 return {
                     "status": "completed",
                     "message": "Debate completed successfully",
+                    "job_id": workspace.job_id,
                     "trust_score": result.get("trust_score", 50),
-                    "debate_file": "debate_result.json"
+                    "provisional_trust_score": estimate["trust_score"],
+                    "trust_divergence": result["trust_divergence"],
+                    "debate_file": os.path.basename(workspace.debate_result_path)
                 }
             except Exception as e:
                 return {
@@ -299,7 +535,59 @@ async def start_debate():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Debate failed: {str(e)}")
 
-async def create_sample_relevant_files():
+@app.post("/debate/stream")
+async def stream_debate(job_id: Optional[str] = None):
+    """NDJSON stream: the provisional estimate immediately, then the judge's verdict once the debate ends"""
+    workspace = resolve_workspace(job_id, "analysis")
+    await prepare_debate_workspace(workspace)
+    estimate = estimate_trust(analysis_documents(workspace))
+    
+    async def events():
+        yield json.dumps({"event": "estimate", "job_id": workspace.job_id, **estimate}) + "\n"
+        if not DebateOrchestrator:
+            yield json.dumps({"event": "error", "message": "Debate module not available"}) + "\n"
+            return
+        try:
+            result = await run_in_threadpool(run_debate, workspace, workspace.job_id or uuid.uuid4().hex[:12])
+            result = finish_debate(workspace, result, estimate)
+            yield json.dumps({
+                "event": "verdict",
+                "job_id": workspace.job_id,
+                "trust_score": result.get("trust_score", 50),
+                "provisional_trust_score": estimate["trust_score"],
+                "trust_divergence": result["trust_divergence"],
+                "judgment": result.get("judgment", "")
+            }) + "\n"
+        except Exception as e:
+            yield json.dumps({"event": "error", "message": f"Debate failed: {str(e)}"}) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+@app.post("/debate/jobs", status_code=202)
+async def queue_debate(input_data: DebateJobInput):
+    """Queue a debate on an analysis job and return at once; poll /jobs/{job_id} for its verdict"""
+    if not DebateOrchestrator:
+        raise HTTPException(status_code=503, detail="Debate module not available")
+    workspace = resolve_workspace(input_data.analysis_job_id, "analysis")
+    if workspace.job_id is None:
+        raise HTTPException(status_code=400, detail="Queued debates need an analysis job; run /process first")
+    state_store = app.state.state_store
+    if input_data.job_id and state_store.get_job(input_data.job_id) is not None:
+        raise HTTPException(status_code=409, detail=f"Job '{input_data.job_id}' already exists")
+    
+    debate_job_id = input_data.job_id or uuid.uuid4().hex[:12]
+    estimate = estimate_trust(analysis_documents(workspace))
+    state_store.create_job(debate_job_id, "debate", workspace.output_dir, status="queued")
+    app.state.debate_executor.submit(run_debate_job, debate_job_id, workspace, estimate)
+    
+    return {
+        "status": "queued",
+        "job_id": debate_job_id,
+        "analysis_job_id": workspace.job_id,
+        "provisional_trust_score": estimate["trust_score"]
+    }
+
+async def create_sample_relevant_files(workspace: Workspace):
     """Create sample relevant files for demo purposes"""
     sample_common = {
         "topic": "Charles James Kirk (October 14, 1993 – September 10, 2025)",
@@ -318,6 +606,7 @@ async def create_sample_relevant_files():
                         "title": "Wikipedia - Charles James Kirk",
                         "link": "https://en.wikipedia.org/wiki/Charles_James_Kirk", 
                         "snippet": "Political activist and media personality",
+                        "relevance_confidence": 0.95,
                         "trust_score": 0.75,
                         "source_type": "Encyclopedia"
                     }
@@ -343,6 +632,7 @@ async def create_sample_relevant_files():
                         "title": "Analysis of Political Violence",
                         "link": "https://example-leftist.com/analysis",
                         "snippet": "Systemic issues contributing to political violence",
+                        "relevance_confidence": 0.87,
                         "trust_score": 0.68,
                         "source_type": "News Media"
                     }
@@ -368,6 +658,7 @@ async def create_sample_relevant_files():
                         "title": "Conservative Tribute",
                         "link": "https://example-conservative.com/tribute",
                         "snippet": "Remembering a conservative icon",
+                        "relevance_confidence": 0.82,
                         "trust_score": 0.71,
                         "source_type": "Opinion Blog"
                     }
@@ -377,21 +668,20 @@ async def create_sample_relevant_files():
     }
     
     # Write sample files
-    with open("relevant_common.json", "w", encoding="utf-8") as f:
-        json.dump(sample_common, f, indent=2, ensure_ascii=False)
-    
-    with open("relevant_leftist.json", "w", encoding="utf-8") as f:
-        json.dump(sample_leftist, f, indent=2, ensure_ascii=False)
-        
-    with open("relevant_rightist.json", "w", encoding="utf-8") as f:
-        json.dump(sample_rightist, f, indent=2, ensure_ascii=False)
+    workspace.write_json(workspace.relevant_path("common"), sample_common, indent=2)
+    workspace.write_json(workspace.relevant_path("leftist"), sample_leftist, indent=2)
+    workspace.write_json(workspace.relevant_path("rightist"), sample_rightist, indent=2)
 
 @app.get("/debate/result")
-async def get_debate_result():
+async def get_debate_result(job_id: Optional[str] = None):
     """Get the debate result"""
+    workspace = resolve_workspace(job_id, "debate")
     try:
-        if os.path.exists("debate_result.json"):
-            with open("debate_result.json", "r", encoding="utf-8") as f:
+        result = app.state.state_store.debate_result(workspace.job_id)
+        if result is not None:
+            return result
+        elif os.path.exists(workspace.debate_result_path):
+            with open(workspace.debate_result_path, "r", encoding="utf-8") as f:
                 result = json.load(f)
             return result
         else:
@@ -404,12 +694,49 @@ async def get_debate_result():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load debate result: {str(e)}")
 
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get the shared status record of an analysis or debate job"""
+    job = app.state.state_store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'")
+    return job
+
+@app.get("/jobs/{job_id}/stream")
+async def get_job_stream(job_id: str, after: int = Query(0, ge=0)):
+    """Statements finished so far, highest combined_score first; poll with after=next to get only new ones"""
+    job = app.state.state_store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'")
+    
+    items = []
+    stream_path = job_workspace(job_id).stream_path
+    if os.path.exists(stream_path):
+        with open(stream_path, 'r', encoding='utf-8') as f:
+            # Only newline-terminated lines are complete; a line still being written is left for the next poll
+            lines = [line for line in f if line.endswith('\n')]
+        items = [json.loads(line) for line in lines[after:]]
+    
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "items": items,
+        "next": after + len(items)
+    }
+
 @app.get("/status")
 async def get_status():
     """Get current system status"""
+    state_store = app.state.state_store
     return {
         "status": "ready",
         "timestamp": datetime.now().isoformat(),
+        "worker_pid": os.getpid(),
+        "current_analysis": state_store.get_current("analysis"),
+        "current_debate": state_store.get_current("debate"),
+        "circuit_breakers": breakers.snapshot(),
+        "llm_gate": app.state.llm_gate.snapshot(),
+        "resources": app.state.resources.snapshot() if app.state.resources else None,
         "modules_available": {
             "analysis": RelevanceSearchSystem is not None,
             "debate": DebateOrchestrator is not None
@@ -426,10 +753,11 @@ if __name__ == "__main__":
     print(f"Starting Information Trust Analysis System on port {port}")
     print("Frontend available at: http://localhost:{port}")
     
+    # Shared state lives in the state store, so any number of worker processes give consistent answers
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+Shared server state (jobs, current pointers, debate output) that every worker process sees the same way
+"""
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class StateStore(ABC):
+    """Storage interface for state that must be consistent across uvicorn workers and replicas"""
+
+    @abstractmethod
+    def create_job(self, job_id: str, kind: str, workspace_dir: str, status: str = "running") -> None:
+        ...
+
+    @abstractmethod
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        ...
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def set_current(self, name: str, job_id: Optional[str]) -> None:
+        ...
+
+    @abstractmethod
+    def get_current(self, name: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def save_debate_result(self, job_id: Optional[str], result: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def debate_result(self, job_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        ...
+
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    workspace_dir TEXT NOT NULL,
+    topic_id INTEGER,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_kind ON jobs(kind, created_at);
+
+CREATE TABLE IF NOT EXISTS current_state (
+    name TEXT PRIMARY KEY,
+    job_id TEXT,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS debate_results (
+    job_id TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteStateStore(StateStore):
+    JOB_FIELDS = ('status', 'topic_id', 'result', 'error')
+
+    def __init__(self, db_path: str = "results.db"):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(STATE_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SQLiteStateStore':
+        return cls(config.get('storage_settings', {}).get('database', 'results.db'))
+
+    @contextmanager
+    def _connect(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        # Autocommit mode plus an explicit BEGIN IMMEDIATE takes the write lock up front,
+        # so concurrent workers queue on busy_timeout instead of failing mid-transaction
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            if write:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            else:
+                yield conn
+        finally:
+            conn.close()
+
+    def create_job(self, job_id: str, kind: str, workspace_dir: str, status: str = "running") -> None:
+        now = time.time()
+        with self._connect(write=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, kind, status, workspace_dir, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, status, workspace_dir, now, now)
+            )
+
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        unknown = set(fields) - set(self.JOB_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+        if 'result' in fields and fields['result'] is not None:
+            fields['result'] = json.dumps(fields['result'], ensure_ascii=False)
+
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect(write=True) as conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE job_id = ?",
+                (*fields.values(), time.time(), job_id)
+            )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        if job['result'] is not None:
+            job['result'] = json.loads(job['result'])
+        return job
+
+    def set_current(self, name: str, job_id: Optional[str]) -> None:
+        with self._connect(write=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO current_state (name, job_id, updated_at) VALUES (?, ?, ?)",
+                (name, job_id, time.time())
+            )
+
+    def get_current(self, name: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT job_id FROM current_state WHERE name = ?", (name,)).fetchone()
+        return row['job_id'] if row else None
+
+    def save_debate_result(self, job_id: Optional[str], result: Dict[str, Any]) -> None:
+        # The legacy working-directory layout has no job id and is stored under the empty key
+        with self._connect(write=True) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO debate_results (job_id, result, updated_at) VALUES (?, ?, ?)",
+                (job_id or "", json.dumps(result, ensure_ascii=False), time.time())
+            )
+
+    def debate_result(self, job_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT result FROM debate_results WHERE job_id = ?", (job_id or "",)).fetchone()
+        return json.loads(row['result']) if row else None
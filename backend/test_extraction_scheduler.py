@@ -0,0 +1,224 @@
+"""
+Extraction scheduling against local fixture sites on several ports: per-host limits, host rotation and deadlines
+"""
+import json
+import os
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from deadline import Deadline
+from extraction_scheduler import PoliteScheduler, host_key
+from page_cache import PageCache
+from result_store import ResultStore
+from workspace import Workspace
+
+
+class FixtureSites:
+    """One slow HTTP server per port, logging (host, path, start, end) for every page before it is sent"""
+
+    def __init__(self, count: int, page_seconds: float):
+        self.page_seconds = page_seconds
+        self.hits = []
+        self._lock = threading.Lock()
+        sites = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                start = time.monotonic()
+                time.sleep(sites.page_seconds)
+                # Logged before the response goes out, so a client holding the page always finds its hit
+                with sites._lock:
+                    sites.hits.append((f"127.0.0.1:{self.server.server_port}", self.path, start, time.monotonic()))
+                body = f"page {self.path}".encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.servers = [ThreadingHTTPServer(('127.0.0.1', 0), Handler) for _ in range(count)]
+        for server in self.servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.hosts = [f"127.0.0.1:{server.server_port}" for server in self.servers]
+
+    def url(self, site: int, path: str) -> str:
+        return f"http://{self.hosts[site]}/{path}"
+
+    def close(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+
+@pytest.fixture
+def sites():
+    fixture = FixtureSites(3, page_seconds=0.1)
+    yield fixture
+    fixture.close()
+
+
+def fetch(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read().decode()
+
+
+def test_host_key_keeps_port_and_drops_www():
+    assert host_key('http://www.example.com:8080/a') == 'example.com:8080'
+    assert host_key('https://user@Example.com/b') == 'example.com'
+
+
+def test_per_host_limits_hold_while_hosts_run_in_parallel(sites):
+    # Start and end are taken where the scheduler runs the task, not where the server receives it
+    visits = []
+    visits_lock = threading.Lock()
+
+    def timed_fetch(url):
+        start = time.monotonic()
+        page = fetch(url)
+        with visits_lock:
+            visits.append((host_key(url), start, time.monotonic()))
+        return page
+
+    scheduler = PoliteScheduler(workers=3, per_host_concurrency=1, min_host_interval=0.2)
+    futures = [scheduler.submit(sites.url(site, f"p{page}"), timed_fetch, sites.url(site, f"p{page}"))
+               for page in range(3) for site in range(3)]
+    assert [future.result(timeout=10) for future in futures] == [f"page /p{page}" for page in range(3) for _ in range(3)]
+    scheduler.shutdown()
+
+    for host in sites.hosts:
+        host_visits = sorted((start, end) for visit_host, start, end in visits if visit_host == host)
+        assert len(host_visits) == 3
+        for (start, end), (next_start, _) in zip(host_visits, host_visits[1:]):
+            assert next_start >= end
+            assert next_start - start >= 0.2 - 0.02
+
+    # Different hosts are loaded at the same time
+    first_visits = [min(start for visit_host, start, _ in visits if visit_host == host) for host in sites.hosts]
+    assert max(first_visits) - min(first_visits) < sites.page_seconds
+
+
+def test_hosts_are_served_round_robin(sites):
+    scheduler = PoliteScheduler(workers=1, per_host_concurrency=1, min_host_interval=0)
+    # The only worker is held until every task is queued
+    gate = threading.Event()
+    scheduler.submit('http://gate.invalid/', gate.wait, 5)
+    order = [(0, 'a1'), (0, 'a2'), (0, 'a3'), (1, 'b1'), (1, 'b2'), (2, 'c1')]
+    futures = [scheduler.submit(sites.url(site, path), fetch, sites.url(site, path)) for site, path in order]
+    gate.set()
+    for future in futures:
+        future.result(timeout=10)
+    scheduler.shutdown()
+
+    served = [path for _, path, _, _ in sorted(sites.hits, key=lambda hit: hit[2])]
+    assert served == ['/a1', '/b1', '/c1', '/a2', '/b2', '/a3']
+
+
+def test_cancelled_tasks_do_not_hold_up_the_host():
+    scheduler = PoliteScheduler(workers=1, per_host_concurrency=1, min_host_interval=0.3)
+    url = 'http://shared.invalid/'
+    first = scheduler.submit(url, time.monotonic)
+    # Another run gives up its queued pages on the same host
+    for future in [scheduler.submit(url, time.monotonic) for _ in range(5)]:
+        future.cancel()
+    started = scheduler.submit(url, time.monotonic)
+    waited = started.result(timeout=10) - first.result(timeout=10)
+    scheduler.shutdown()
+
+    assert 0.3 - 0.05 <= waited < 0.6
+
+
+def test_shutdown_refuses_new_tasks():
+    scheduler = PoliteScheduler()
+    scheduler.shutdown()
+    with pytest.raises(RuntimeError):
+        scheduler.submit('http://example.com/', fetch, 'http://example.com/')
+
+
+def analysis_system(tmp_path, monkeypatch, scheduler, links, relevance_seconds, page_cache=None):
+    """A RelevanceSearchSystem over stub search and relevance calls, extracting from the fixture sites"""
+    from main import RelevanceSearchSystem
+
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json'), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    monkeypatch.chdir(tmp_path)
+    resources = SimpleNamespace(
+        config=config, api_key='', search_engine_id='', search_service=None, gemini_model=None,
+        store=ResultStore(str(tmp_path / 'results.db')), page_cache=page_cache, extractor=scheduler, browsers=None
+    )
+    workspace = Workspace.create_job({'topic': 'Fixture topic', 'text': 'context'}, jobs_root=str(tmp_path / 'jobs'))
+    system = RelevanceSearchSystem(workspace=workspace, resources=resources)
+    system.delay = 0
+    system.search_pages = 1
+    system.dedupe_enabled = False
+    system.clustering_enabled = False
+
+    def evaluate_relevance(link, text):
+        time.sleep(relevance_seconds)
+        return {'relevant': True, 'confidence': 1.0, 'reason': 'fixture',
+                'trust': {'trust_score': 0.8, 'source_type': 'News', 'trust_reasoning': 'fixture'}}
+
+    system._rephrase = lambda source_file, idx, text: text
+    system.search_google = lambda query, rephrased, *args, **kwargs: links
+    system.evaluate_relevance = evaluate_relevance
+    system.extract_content_from_url = fetch
+    return system
+
+
+def fixture_links(sites, count):
+    return [{'title': f"Link {i}", 'link': sites.url(i % 3, f"l{i}"), 'snippet': f"snippet {i}"} for i in range(count)]
+
+
+def test_deadline_keeps_extractions_that_finished_in_time(sites, tmp_path, monkeypatch):
+    sites.page_seconds = 0.02
+    scheduler = PoliteScheduler(workers=3, per_host_concurrency=1, min_host_interval=0)
+    # Six relevance checks of 0.2s overrun a 1.1s deadline on the last one; the five before it were
+    # extracted before the deadline passed
+    system = analysis_system(tmp_path, monkeypatch, scheduler, fixture_links(sites, 6), relevance_seconds=0.2)
+    system.deadline = Deadline(1.1)
+
+    result = system.process_item('fixture.json', 0, {'text': 'A statement about the fixture topic'})
+    scheduler.shutdown()
+
+    assert result['partial']
+    assert [link['link'] for link in result['relevant_links']] == [link['link'] for link in fixture_links(sites, 5)]
+    assert all(link['extracted_content'].startswith('page /l') for link in result['relevant_links'])
+
+
+def test_deadline_cancels_queued_extractions(sites, tmp_path, monkeypatch):
+    sites.page_seconds = 0.3
+    scheduler = PoliteScheduler(workers=1, per_host_concurrency=1, min_host_interval=0)
+    links = [{'title': f"Link {i}", 'link': sites.url(0, f"l{i}"), 'snippet': f"snippet {i}"} for i in range(6)]
+    system = analysis_system(tmp_path, monkeypatch, scheduler, links, relevance_seconds=0)
+    system.deadline = Deadline(0.5)
+
+    result = system.process_item('fixture.json', 0, {'text': 'A statement about the fixture topic'})
+    scheduler.shutdown()
+
+    assert result['partial']
+    assert [link['link'] for link in result['relevant_links']] == [links[0]['link']]
+    # Pages still queued at the deadline were never requested
+    assert len(sites.hits) < len(links)
+
+
+def test_fresh_cached_pages_skip_host_spacing(sites, tmp_path, monkeypatch):
+    scheduler = PoliteScheduler(workers=1, per_host_concurrency=1, min_host_interval=1.0)
+    links = [{'title': f"Link {i}", 'link': sites.url(0, f"l{i}"), 'snippet': f"snippet {i}"} for i in range(4)]
+    page_cache = PageCache(str(tmp_path / 'pages.db'))
+    for link in links:
+        page_cache.put(link['link'], f"cached {link['link']}")
+    system = analysis_system(tmp_path, monkeypatch, scheduler, links, relevance_seconds=0, page_cache=page_cache)
+
+    started = time.monotonic()
+    result = system.process_item('fixture.json', 0, {'text': 'A statement about the fixture topic'})
+    scheduler.shutdown()
+
+    assert time.monotonic() - started < 1.0
+    assert [link['extracted_content'] for link in result['relevant_links']] == [f"cached {link['link']}" for link in links]
+    assert sites.hits == []
@@ -0,0 +1,46 @@
+"""
+Shared lightweight tokenization for the local (non-LLM) scoring stages
+"""
+import re
+from typing import List, Set
+
+
+STOP_WORDS = {
+    'a', 'about', 'after', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'being',
+    'but', 'by', 'can', 'could', 'did', 'do', 'does', 'for', 'from', 'had', 'has', 'have', 'he', 'her',
+    'his', 'how', 'i', 'if', 'in', 'into', 'is', 'it', 'its', 'just', 'more', 'most', 'not', 'of', 'on',
+    'or', 'our', 'out', 'over', 'she', 'so', 'some', 'such', 'than', 'that', 'the', 'their', 'them',
+    'then', 'there', 'these', 'they', 'this', 'those', 'to', 'up', 'us', 'was', 'we', 'were', 'what',
+    'when', 'which', 'while', 'who', 'will', 'with', 'would', 'you', 'your'
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def normalize_token(token: str) -> str:
+    """Crude suffix stripping so 'assassinated' and 'assassination' land on the same stem"""
+    if token.endswith("'s"):
+        token = token[:-2]
+    for suffix in ('ations', 'ation', 'ings', 'ing', 'ed', 'es', 's'):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased content-word stems, stop words and one-character tokens removed"""
+    return [
+        normalize_token(token)
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def token_set(text: str) -> Set[str]:
+    return set(tokenize(text))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
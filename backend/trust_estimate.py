@@ -0,0 +1,93 @@
+"""
+Deterministic provisional trust estimate computed straight from an analysis, before any debate runs
+"""
+from typing import Any, Dict, Optional
+
+from domain_trust import host_of, registrable_domain
+
+
+# Blend of the evidence itself and the two corroboration signals, all on a 0-1 scale
+EVIDENCE_WEIGHT = 0.7
+DIVERSITY_WEIGHT = 0.15
+AGREEMENT_WEIGHT = 0.15
+# Source types needed for full diversity credit
+DIVERSITY_TARGET = 4
+
+
+def _mean(values) -> Optional[float]:
+    values = list(values)
+    return sum(values) / len(values) if values else None
+
+
+def estimate_trust(documents: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    documents maps perspective -> relevant_*.json document. Each statement's evidence is its
+    relevance-weighted mean link trust; statements are weighted by bias_x * significance_y
+    like the rest of the pipeline. Source-type diversity and leftist/rightist agreement are
+    blended in as corroboration. Returns a 0-100 score on the judge's scale plus its components.
+    """
+    weighted_evidence = total_weight = 0.0
+    statements = statements_with_evidence = links = 0
+    source_types = set()
+    perspective_trust: Dict[str, list] = {}
+    perspective_domains: Dict[str, set] = {}
+
+    for perspective, document in documents.items():
+        for item in document.get('items', []):
+            item_links = [link for link in item.get('relevant_links', []) if link.get('trust_score') is not None]
+            statements += 1
+            if not item_links:
+                continue
+
+            relevance = [link.get('relevance_confidence') or 0.5 for link in item_links]
+            evidence = sum(r * link['trust_score'] for r, link in zip(relevance, item_links)) / sum(relevance)
+            weight = (item.get('bias_x', 0.5) or 0.0) * (item.get('significance_y', 0.5) or 0.0) or 0.01
+
+            weighted_evidence += weight * evidence
+            total_weight += weight
+            statements_with_evidence += 1
+            links += len(item_links)
+            for link in item_links:
+                source_types.add((link.get('source_type') or 'Unknown').lower())
+                perspective_trust.setdefault(perspective, []).append(link['trust_score'])
+                host = host_of(link.get('link', ''))
+                if host:
+                    perspective_domains.setdefault(perspective, set()).add(registrable_domain(host))
+
+    if not total_weight:
+        return {
+            'trust_score': 50,
+            'confidence': 0.0,
+            'statements_considered': statements,
+            'links_considered': 0,
+            'components': {}
+        }
+
+    evidence_score = weighted_evidence / total_weight
+    diversity = min(1.0, len(source_types) / DIVERSITY_TARGET)
+
+    # Agreement: both sides' sources earn similar trust, plus credit for citing the same outlets
+    left, right = _mean(perspective_trust.get('leftist', [])), _mean(perspective_trust.get('rightist', []))
+    if left is None or right is None:
+        agreement = 0.5
+    else:
+        left_domains, right_domains = perspective_domains.get('leftist', set()), perspective_domains.get('rightist', set())
+        shared = len(left_domains & right_domains) / len(left_domains | right_domains) if left_domains | right_domains else 0.0
+        agreement = 0.8 * (1 - abs(left - right)) + 0.2 * shared
+
+    score = EVIDENCE_WEIGHT * evidence_score + DIVERSITY_WEIGHT * diversity + AGREEMENT_WEIGHT * agreement
+    return {
+        'trust_score': round(100 * score),
+        # Share of statements that had any evidence; a thin analysis gives a less reliable estimate
+        'confidence': round(statements_with_evidence / statements, 3),
+        'statements_considered': statements,
+        'links_considered': links,
+        'components': {
+            'evidence': round(evidence_score, 4),
+            'source_diversity': round(diversity, 4),
+            'cross_perspective_agreement': round(agreement, 4),
+            'perspective_mean_trust': {
+                perspective: round(_mean(values), 4) for perspective, values in perspective_trust.items()
+            }
+        }
+    }
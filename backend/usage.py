@@ -0,0 +1,62 @@
+"""
+Per-run accounting of paid calls (Gemini tokens, Custom Search queries, browser page loads) with hard budgets
+"""
+import threading
+from typing import Any, Dict, Optional
+
+
+class BudgetExhausted(Exception):
+    def __init__(self, counter: str):
+        super().__init__(f"{counter} budget exhausted")
+        self.counter = counter
+
+
+class UsageLedger:
+    COUNTERS = ('llm_calls', 'prompt_tokens', 'output_tokens', 'search_queries', 'page_loads')
+    LLM_COUNTERS = ('llm_calls', 'prompt_tokens', 'output_tokens')
+
+    def __init__(self, budgets: Optional[Dict[str, int]] = None):
+        # A missing or zero budget means unlimited
+        self.budgets = {name: limit for name, limit in (budgets or {}).items() if name in self.COUNTERS and limit}
+        self.totals = {name: 0 for name in self.COUNTERS}
+        self.skipped: Dict[str, int] = {}
+        # Concurrent search pages and extraction workers reserve against the same totals
+        self._lock = threading.Lock()
+
+    def _exhausted(self, counters) -> Optional[str]:
+        for name in counters:
+            if name in self.budgets and self.totals[name] >= self.budgets[name]:
+                return name
+        return None
+
+    def reserve(self, kind: str) -> None:
+        """
+        Count one call of this kind ('llm', 'search_queries', 'page_loads') before it goes out, or raise
+        BudgetExhausted. Check and count are one step, so concurrent callers cannot overrun a call budget;
+        token budgets can only be checked, since a call's tokens are known once it returns.
+        """
+        with self._lock:
+            exhausted = self._exhausted(self.LLM_COUNTERS if kind == 'llm' else (kind,))
+            if exhausted:
+                self.skipped[kind] = self.skipped.get(kind, 0) + 1
+                raise BudgetExhausted(exhausted)
+            self.totals['llm_calls' if kind == 'llm' else kind] += 1
+
+    def release(self, kind: str) -> None:
+        """Give back a reservation whose call never went out"""
+        with self._lock:
+            self.totals['llm_calls' if kind == 'llm' else kind] -= 1
+
+    def record_llm(self, response: Any) -> None:
+        metadata = getattr(response, 'usage_metadata', None)
+        with self._lock:
+            self.totals['prompt_tokens'] += getattr(metadata, 'prompt_token_count', 0) or 0
+            self.totals['output_tokens'] += getattr(metadata, 'candidates_token_count', 0) or 0
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'totals': dict(self.totals),
+            'budgets': dict(self.budgets),
+            'exhausted': [name for name in self.COUNTERS if self._exhausted((name,))],
+            'skipped_calls': dict(self.skipped)
+        }
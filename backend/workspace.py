@@ -0,0 +1,85 @@
+"""
+Per-run workspaces so concurrent analyses and debates never share input/output files
+"""
+import json
+import os
+import uuid
+from typing import Any, Dict, Optional
+
+
+class Workspace:
+    PERSPECTIVES = ('common', 'leftist', 'rightist')
+
+    def __init__(
+        self,
+        output_dir: str = ".",
+        input_path: str = os.path.join('data', 'input.json'),
+        data_folder: str = 'data',
+        job_id: Optional[str] = None
+    ):
+        # The default workspace reproduces the original single-run layout in the working directory
+        self.output_dir = output_dir
+        self.input_path = input_path
+        self.data_folder = data_folder
+        self.job_id = job_id
+
+    @classmethod
+    def create_job(
+        cls,
+        input_data: Dict[str, Any],
+        jobs_root: str = 'jobs',
+        data_folder: str = 'data',
+        job_id: Optional[str] = None
+    ) -> 'Workspace':
+        workspace = cls.open_job(job_id or uuid.uuid4().hex[:12], jobs_root=jobs_root, data_folder=data_folder)
+        os.makedirs(workspace.output_dir, exist_ok=True)
+        workspace.write_input(input_data)
+        return workspace
+
+    @classmethod
+    def open_job(cls, job_id: str, jobs_root: str = 'jobs', data_folder: str = 'data') -> 'Workspace':
+        """Re-open an existing job workspace without touching its files"""
+        output_dir = os.path.join(jobs_root, job_id)
+        return cls(
+            output_dir=output_dir,
+            input_path=os.path.join(output_dir, 'input.json'),
+            data_folder=data_folder,
+            job_id=job_id
+        )
+
+    def output_path(self, filename: str) -> str:
+        return os.path.join(self.output_dir, filename)
+
+    def relevant_path(self, perspective: str) -> str:
+        return self.output_path(f'relevant_{perspective}.json')
+
+    @property
+    def relevant_paths(self) -> Dict[str, str]:
+        return {perspective: self.relevant_path(perspective) for perspective in self.PERSPECTIVES}
+
+    @property
+    def checkpoint_path(self) -> str:
+        return self.output_path('checkpoint.jsonl')
+
+    @property
+    def stream_path(self) -> str:
+        return self.output_path('stream.jsonl')
+
+    @property
+    def debate_result_path(self) -> str:
+        return self.output_path('debate_result.json')
+
+    def write_json(self, path: str, data: Dict[str, Any], indent: int = 4) -> None:
+        """Write via a temp file and atomic rename so readers never see a half-written file"""
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def load_input(self) -> Dict[str, Any]:
+        with open(self.input_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_input(self, input_data: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.input_path) or '.', exist_ok=True)
+        self.write_json(self.input_path, input_data, indent=2)